@@ -20,4 +20,5 @@ setup(
     ],
     python_requires=">=3.6",
     install_requires=["numpy"],  # Dependencies your project needs
+    extras_require={"jit": ["numba"]},  # Compiles the numeric kernels when installed
 )
@@ -0,0 +1,20 @@
+"""
+Optional Numba support for the numeric kernels.
+
+Kernels are decorated with `njit` from this module. When Numba is installed
+(``pip install soilstat[jit]``) they are compiled to machine code, otherwise
+the decorator returns the plain Python function unchanged.
+"""
+
+try:
+    from numba import njit
+except ImportError:
+
+    def njit(*args, **kwargs):
+        """
+        Fallback for `numba.njit` that leaves the decorated function as it is.
+        """
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+
+        return lambda func: func
@@ -1,7 +1,59 @@
 import math
-from typing import Tuple, Annotated
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, Tuple, Annotated
+import numpy as np
 from pydantic import Field, validate_call
 
+_RAD = math.pi / 180.0
+_PI_4 = math.pi / 4
+
+
+def _tan_deg(angle: float) -> float:
+    """
+    Tangent of an angle given in degrees.
+    """
+    return math.tan(angle * _RAD)
+
+
+@dataclass(frozen=True)
+class PhiTrig:
+    """
+    Trigonometric terms of the friction angle shared by the factor kernels.
+
+    Attributes:
+        phi_rad (float): Friction angle in radians.
+        tan_phi (float): Tangent of the friction angle.
+        sin_phi (float): Sine of the friction angle.
+        cot_phi (float): Cotangent of the friction angle (inf when phi is 0).
+    """
+
+    phi_rad: float
+    tan_phi: float
+    sin_phi: float
+    cot_phi: float
+
+    @classmethod
+    def from_degrees(cls, phi: float) -> "PhiTrig":
+        """
+        Builds the trigonometric terms from a friction angle in degrees.
+        """
+        phi_rad = phi * _RAD
+        tan_phi = math.tan(phi_rad)
+        cot_phi = 1 / tan_phi if tan_phi else math.inf
+
+        return cls(phi_rad, tan_phi, math.sin(phi_rad), cot_phi)
+
+
+# Friction angles usually come from a small set of values per profile, so the
+# trigonometric terms and the phi-only factor kernels below are memoized
+@lru_cache(maxsize=256)
+def _phi_trig(phi: float) -> PhiTrig:
+    """
+    Returns the cached trigonometric terms of a friction angle in degrees.
+    """
+    return PhiTrig.from_degrees(phi)
+
 
 @validate_call
 def calc_bearing_capacity_factors(
@@ -16,22 +68,73 @@ def calc_bearing_capacity_factors(
     Returns:
         Tuple[float, float, float]: A tuple containing (Nc, Nq, Ng) bearing capacity factors.
     """
-    phi_rad = math.radians(phi)
+    return _calc_bearing_capacity_factors_fast(_phi_trig(phi))
 
-    nq = math.exp(math.pi * math.tan(phi_rad)) * math.pow(
-        math.tan(math.radians(45 + phi / 2)), 2
-    )
 
-    if phi == 0:
-        nc = 5.14
-    else:
-        nc = (nq - 1) / math.tan(phi_rad)
+@lru_cache(maxsize=256)
+def _calc_bearing_capacity_factors_fast(trig: PhiTrig) -> Tuple[float, float, float]:
+    """
+    Computes the bearing capacity factors Nc, Nq, and Ng without validating the input.
+
+    Parameters:
+        trig (PhiTrig): Precomputed trigonometric terms of the friction angle.
+
+    Returns:
+        Tuple[float, float, float]: A tuple containing (Nc, Nq, Ng) bearing capacity factors.
+    """
+    if trig.phi_rad == 0:
+        return _vesic_phi_zero()
+
+    return _vesic_phi_nonzero(trig)
+
+
+def _vesic_phi_zero() -> Tuple[float, float, float]:
+    """
+    Bearing capacity factors (Nc, Nq, Ng) of a purely cohesive soil (phi = 0).
+    """
+    return 5.14, 1.0, 0.0
+
 
-    ng = 2 * (nq - 1) * math.tan(phi_rad)
+def _vesic_phi_nonzero(trig: PhiTrig) -> Tuple[float, float, float]:
+    """
+    Bearing capacity factors (Nc, Nq, Ng) for a friction angle greater than 0.
+    """
+    tan_phi = trig.tan_phi
+    # tan²(45 + phi/2) == (1 + sin(phi)) / (1 - sin(phi))
+    nq = math.exp(math.pi * tan_phi) * (1 + trig.sin_phi) / (1 - trig.sin_phi)
+    nc = (nq - 1) * trig.cot_phi
+    ng = 2 * (nq - 1) * tan_phi
 
     return nc, nq, ng
 
 
+def calc_bearing_capacity_factors_vec(phi: np.ndarray) -> np.ndarray:
+    """
+    Computes the bearing capacity factors Nc, Nq, and Ng for an array of friction angles.
+
+    Parameters:
+        phi (np.ndarray): Friction angles in degrees, each between 0 and 90.
+
+    Returns:
+        np.ndarray: An array of shape (3, N) whose rows are the Nc, Nq and Ng factors.
+    """
+    phi = np.asarray(phi, dtype=np.float64)
+    if np.any((phi < 0) | (phi > 90)):
+        raise ValueError("Friction angles must be between 0 and 90 degrees.")
+
+    phi_rad = phi * _RAD
+    tan_phi = np.tan(phi_rad)
+    tan_45 = np.tan(_PI_4 + phi_rad / 2)
+
+    cohesive = phi == 0
+    nq = np.where(cohesive, 1.0, np.exp(math.pi * tan_phi) * tan_45 * tan_45)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        nc = np.where(cohesive, 5.14, (nq - 1) / tan_phi)
+    ng = np.where(cohesive, 0.0, 2 * (nq - 1) * tan_phi)
+
+    return np.stack((nc, nq, ng))
+
+
 @validate_call
 def calc_shape_factors(
     foundation_width: Annotated[float, Field(gt=0)],
@@ -53,8 +156,21 @@ def calc_shape_factors(
     Returns:
         Tuple[float, float, float]: A tuple containing (Sc, Sq, Sg) shape factors.
     """
-    if phi < 0 or phi > 90:
-        raise ValueError("Phi must be between 0 and 90 degrees")
+    return _calc_shape_factors(
+        foundation_width, foundation_length, nq, nc, _phi_trig(phi)
+    )
+
+
+def _calc_shape_factors(
+    foundation_width: float,
+    foundation_length: float,
+    nq: float,
+    nc: float,
+    trig: PhiTrig,
+) -> Tuple[float, float, float]:
+    """
+    Calculate the shape factors (Sc, Sq, and Sg) without validating the inputs.
+    """
     # Calculate width / length ration
     w_l = foundation_width / foundation_length
 
@@ -62,7 +178,7 @@ def calc_shape_factors(
     sc = 1 + w_l * (nq / nc)
 
     # Calculate Sq
-    sq = 1 + w_l * math.tan(math.radians(phi))
+    sq = 1 + w_l * trig.tan_phi
 
     # Calculate Sg
     sg = 1 - 0.4 * w_l
@@ -71,6 +187,47 @@ def calc_shape_factors(
     return sc, sq, sg
 
 
+def calc_shape_factors_vec(
+    foundation_width: np.ndarray,
+    foundation_length: np.ndarray,
+    nq: np.ndarray,
+    nc: np.ndarray,
+    phi: np.ndarray,
+) -> np.ndarray:
+    """
+    Computes the shape factors Sc, Sq, and Sg for arrays of foundations.
+
+    The inputs are broadcast against each other, so scalars can be mixed with arrays.
+
+    Parameters:
+        foundation_width (np.ndarray): Widths of the foundations (m), each greater than 0.
+        foundation_length (np.ndarray): Lengths of the foundations (m), each greater than 0.
+        nq (np.ndarray): Bearing capacity factors Nq, each greater than 0.
+        nc (np.ndarray): Bearing capacity factors Nc, each greater than 0.
+        phi (np.ndarray): Friction angles in degrees, each between 0 and 90.
+
+    Returns:
+        np.ndarray: An array of shape (3, N) whose rows are the Sc, Sq and Sg factors.
+    """
+    w, l, nq, nc, phi = np.broadcast_arrays(
+        *(
+            np.asarray(a, dtype=np.float64)
+            for a in (foundation_width, foundation_length, nq, nc, phi)
+        )
+    )
+    if np.any((w <= 0) | (l <= 0) | (nq <= 0) | (nc <= 0)):
+        raise ValueError("Foundation sizes and Nq, Nc factors must be greater than 0.")
+    if np.any((phi < 0) | (phi > 90)):
+        raise ValueError("Friction angles must be between 0 and 90 degrees.")
+
+    w_l = w / l
+    sc = 1 + w_l * (nq / nc)
+    sq = 1 + w_l * np.tan(phi * _RAD)
+    sg = np.maximum(1 - 0.4 * w_l, 0.6)
+
+    return np.stack((sc, sq, sg))
+
+
 @validate_call
 def calc_load_inclination_factors(
     phi: Annotated[float, Field(ge=0, le=90)],
@@ -98,6 +255,38 @@ def calc_load_inclination_factors(
     Returns:
         Tuple[float, float, float]: A tuple containing (ic, iq, ig) load inclination factors.
     """
+    trig = _phi_trig(phi)
+    nc, nq, _ = _calc_bearing_capacity_factors_fast(trig)
+
+    return _calc_load_inclination_factors(
+        trig,
+        nc,
+        nq,
+        cohesion,
+        foundation_width,
+        foundation_length,
+        foundation_base_angle,
+        vertical_load,
+        horizontal_load_x,
+        horizontal_load_y,
+    )
+
+
+def _calc_load_inclination_factors(
+    trig: PhiTrig,
+    nc: float,
+    nq: float,
+    cohesion: float,
+    foundation_width: float,
+    foundation_length: float,
+    foundation_base_angle: float,
+    vertical_load: float,
+    horizontal_load_x: float,
+    horizontal_load_y: float,
+) -> Tuple[float, float, float]:
+    """
+    Calculate the load inclination factors (ic, iq, ig) without validating the inputs.
+    """
     # Base angle, dimensions, and loads
     base_angle = foundation_base_angle
     w = foundation_width
@@ -107,9 +296,6 @@ def calc_load_inclination_factors(
     w_l = foundation_width / foundation_length
     vmax = max(horizontal_load_y, horizontal_load_x)
 
-    # Calculate bearing capacity factors
-    nc, nq, _ = calc_bearing_capacity_factors(phi)
-
     ic, iq, ig = 1.0, 1.0, 1.0
 
     if base_angle > 0:
@@ -117,12 +303,12 @@ def calc_load_inclination_factors(
         ca = cohesion * 0.75
         m = (2 + w_l) / (1 + w_l)
 
-        if phi == 0:
+        if trig.phi_rad == 0:
             ic = 1 - m * vmax / (area * ca * nc)
             iq = 1
             ig = 1
         else:
-            tan_phi_inv = 1 / math.tan(math.radians(phi))
+            tan_phi_inv = trig.cot_phi
             iq = math.pow(1 - (vmax / (f + area * ca * tan_phi_inv)), m)
             ig = math.pow(1 - (vmax / (f + area * ca * tan_phi_inv)), m + 1)
             ic = iq - (1 - iq) / (nq - 1)
@@ -147,12 +333,23 @@ def calc_base_factors(
     Returns:
         Tuple[float, float, float]: A tuple containing (bc, bq, bg) base factors.
     """
-    if phi == 0:
-        bc = 1 - math.radians(slope_angle) / 5.14
-    else:
-        bc = 1 - 2 * math.radians(slope_angle) / (5.14 * math.tan(math.radians(phi)))
+    return _calc_base_factors(_phi_trig(phi), slope_angle, base_angle)
+
+
+@lru_cache(maxsize=256)
+def _calc_base_factors(
+    trig: PhiTrig, slope_angle: float, base_angle: float
+) -> Tuple[float, float, float]:
+    """
+    Calculate the base factors (bc, bq, bg) without validating the inputs.
+    """
+    if trig.phi_rad == 0:
+        # tan(phi) is 0, so bq and bg reduce to 1
+        return 1 - slope_angle * _RAD / 5.14, 1.0, 1.0
 
-    bq = math.pow(1 - math.radians(base_angle) * math.tan(math.radians(phi)), 2)
+    bc = 1 - 2 * slope_angle * _RAD / (5.14 * trig.tan_phi)
+    bq_root = 1 - base_angle * _RAD * trig.tan_phi
+    bq = bq_root * bq_root
     bg = bq
 
     return bc, bq, bg
@@ -175,14 +372,24 @@ def calc_ground_factors(
     Returns:
         Tuple[float, float, float]: A tuple containing (gc, gq, gg) ground factors.
     """
+    return _calc_ground_factors(iq, slope_angle, _phi_trig(phi))
+
+
+def _calc_ground_factors(
+    iq: float, slope_angle: float, trig: PhiTrig
+) -> Tuple[float, float, float]:
+    """
+    Calculate the ground factors (gc, gq, gg) without validating the inputs.
+    """
     # Calculate gc
-    if phi == 0:
-        gc = 1 - math.radians(slope_angle) / 5.14
+    if trig.phi_rad == 0:
+        gc = 1 - slope_angle * _RAD / 5.14
     else:
-        gc = iq - (1 - iq) / (5.14 * math.tan(math.radians(phi)))
+        gc = iq - (1 - iq) / (5.14 * trig.tan_phi)
 
     # Calculate gq and gg
-    gq = math.pow(1 - math.tan(math.radians(slope_angle)), 2)
+    gq_root = 1 - _tan_deg(slope_angle)
+    gq = gq_root * gq_root
     gg = gq
 
     return gc, gq, gg
@@ -205,6 +412,16 @@ def calc_depth_factors(
     Returns:
         Tuple[float, float, float]: A tuple containing (dc, dq, dg) depth factors.
     """
+    return _calc_depth_factors(foundation_depth, foundation_width, _phi_trig(phi))
+
+
+@lru_cache(maxsize=256)
+def _calc_depth_factors(
+    foundation_depth: float, foundation_width: float, trig: PhiTrig
+) -> Tuple[float, float, float]:
+    """
+    Calculate the depth factors (dc, dq, dg) without validating the inputs.
+    """
     df = foundation_depth
     w = foundation_width
 
@@ -215,13 +432,75 @@ def calc_depth_factors(
 
     # Calculate depth factors
     dc = 1 + 0.4 * db
-    dq = (
-        1
-        + 2
-        * math.tan(math.radians(phi))
-        * math.pow(1 - math.sin(math.radians(phi)), 2)
-        * db
-    )
+    one_minus_sin = 1 - trig.sin_phi
+    dq = 1 + 2 * trig.tan_phi * one_minus_sin * one_minus_sin * db
     dg = 1
 
     return dc, dq, dg
+
+
+@validate_call
+def calc_all_vesic_factors(
+    phi: Annotated[float, Field(ge=0, le=90)],
+    cohesion: Annotated[float, Field(ge=0)],
+    foundation_width: Annotated[float, Field(gt=0)],
+    foundation_length: Annotated[float, Field(gt=0)],
+    foundation_depth: Annotated[float, Field(ge=0)],
+    foundation_base_angle: Annotated[float, Field(ge=0, le=90)],
+    slope_angle: Annotated[float, Field(ge=0, le=90)],
+    vertical_load: Annotated[float, Field(ge=0)],
+    horizontal_load_x: Annotated[float, Field(ge=0)],
+    horizontal_load_y: Annotated[float, Field(ge=0)],
+) -> Dict[str, Tuple[float, float, float]]:
+    """
+    Calculate every Vesic factor set for a single foundation analysis.
+
+    The inputs are validated once and the trigonometric terms of phi are shared
+    between all of the factor calculations.
+
+    Parameters:
+        phi (float): Angle of internal friction in degrees.
+        cohesion (float): Soil cohesion (kPa).
+        foundation_width (float): Width of the foundation (m).
+        foundation_length (float): Length of the foundation (m).
+        foundation_depth (float): Depth of the foundation (m).
+        foundation_base_angle (float): Angle of the foundation base (degrees).
+        slope_angle (float): Slope angle in degrees.
+        vertical_load (float): Vertical load of the building (kN).
+        horizontal_load_x (float): Horizontal load in the X direction (kN).
+        horizontal_load_y (float): Horizontal load in the Y direction (kN).
+
+    Returns:
+        Dict[str, Tuple[float, float, float]]: A dictionary containing the following keys:
+            - bearing_capacity: (Nc, Nq, Ng) bearing capacity factors.
+            - shape: (Sc, Sq, Sg) shape factors.
+            - load_inclination: (ic, iq, ig) load inclination factors.
+            - base: (bc, bq, bg) base factors.
+            - ground: (gc, gq, gg) ground factors.
+            - depth: (dc, dq, dg) depth factors.
+    """
+    trig = _phi_trig(phi)
+
+    nc, nq, ng = _calc_bearing_capacity_factors_fast(trig)
+    inclination_factors = _calc_load_inclination_factors(
+        trig,
+        nc,
+        nq,
+        cohesion,
+        foundation_width,
+        foundation_length,
+        foundation_base_angle,
+        vertical_load,
+        horizontal_load_x,
+        horizontal_load_y,
+    )
+    iq = inclination_factors[1]
+
+    return {
+        "bearing_capacity": (nc, nq, ng),
+        "shape": _calc_shape_factors(foundation_width, foundation_length, nq, nc, trig),
+        "load_inclination": inclination_factors,
+        "base": _calc_base_factors(trig, slope_angle, foundation_base_angle),
+        "ground": _calc_ground_factors(iq, slope_angle, trig),
+        "depth": _calc_depth_factors(foundation_depth, foundation_width, trig),
+    }
@@ -1,9 +1,37 @@
 import math
+from functools import lru_cache
+import numpy as np
 from soilstat.models.CPT import CPTLog, CPTExp
 from soilstat.models.soil_profile import SoilProfile
-from typing import Dict, Tuple, List
+from typing import Dict, Tuple
 import soilstat.liquefaction.helper_functions as hf
 from soilstat.liquefaction.settlement import settlement_obj
+from soilstat._jit import njit
+
+CN_MAX_ITERATIONS = 50
+
+
+def _calc_dqc_exp(fine_content):
+    """
+    Calculate the fines content exponential used in the qc1n correction.
+
+    Parameters:
+    - fine_content (float or np.ndarray): Fines content percentage.
+
+    Returns:
+    - float or np.ndarray: The value of exp(1.63 - 9.7 / (FC + 2) - (15.7 / (FC + 2))^2).
+    """
+    inv_fc2 = 1.0 / (fine_content + 2)
+    t = 15.7 * inv_fc2
+    return np.exp(1.63 - 9.7 * inv_fc2 - t * t)
+
+
+@lru_cache(maxsize=256)
+def _dqc_exp_factor(fine_content: float) -> float:
+    """
+    Cached `_calc_dqc_exp` for a single fines content.
+    """
+    return float(_calc_dqc_exp(fine_content))
 
 
 def calc_cn(
@@ -18,26 +46,86 @@ def calc_cn(
     - effective_stress (float): Effective stress (in kPa).
     - fine_content (float): Fines content percentage.
 
+    Returns:
+    - float: The calculated Cn value.
+    """
+    return _calc_cn(m, qcn, effective_stress, _dqc_exp_factor(fine_content))
+
+
+@njit(cache=True)
+def _calc_cn(m: float, qcn: float, effective_stress: float, dqc_exp: float) -> float:
+    """
+    Calculate the Cn value iteratively from a precomputed fines content term.
+
+    Parameters::
+    - m (float): Initial m value.
+    - qcn (float): Normalized cone tip resistance.
+    - effective_stress (float): Effective stress (in kPa).
+    - dqc_exp (float): The fines content exponential from `_dqc_exp_factor`.
+
     Returns:
     - float: The calculated Cn value.
     """
     effective_stress = max(
         effective_stress, 0.1
     )  # Ensure effective stress is at least 0.1
-    cn = math.pow(10.132 / effective_stress, m)
-    qc1n0 = qcn * cn
-    dqc1n0 = (11.9 + qc1n0 / 14.6) * math.exp(
-        1.63 - (9.7 / (fine_content + 2)) - math.pow(15.7 / (fine_content + 2), 2)
-    )
 
-    qc1ncs0 = qc1n0 + dqc1n0
-    m_new = 1.338 - 0.249 * math.pow(qc1ncs0, 0.264)
+    for _ in range(CN_MAX_ITERATIONS):
+        cn = math.pow(10.132 / effective_stress, m)
+        qc1n0 = qcn * cn
+        dqc1n0 = (11.9 + qc1n0 / 14.6) * dqc_exp
 
-    # Recursive convergence check
-    if abs(m_new - m) > 0.001:
-        return calc_cn(m_new, qcn, effective_stress, fine_content)
-    else:
-        return min(1.7, math.pow(100 / effective_stress, m))
+        qc1ncs0 = qc1n0 + dqc1n0
+        m_new = 1.338 - 0.249 * math.pow(qc1ncs0, 0.264)
+
+        # Convergence check
+        if abs(m_new - m) <= 0.001:
+            break
+
+        m = m_new
+
+    return min(1.7, math.pow(100 / effective_stress, m))
+
+
+def _calc_cn_array(
+    m: float, qcn: np.ndarray, effective_stress: np.ndarray, dqc_exp: np.ndarray
+) -> np.ndarray:
+    """
+    Vectorized counterpart of `_calc_cn` iterating every depth at once.
+
+    Each depth keeps iterating until its own m value converges, so the result is
+    identical to calling `_calc_cn` element by element.
+
+    Parameters::
+    - m (float): Initial m value.
+    - qcn (np.ndarray): Normalized cone tip resistances.
+    - effective_stress (np.ndarray): Effective stresses (in kPa).
+    - dqc_exp (np.ndarray): The fines content exponentials from `_dqc_exp_factor`.
+
+    Returns:
+    - np.ndarray: The calculated Cn values.
+    """
+    effective_stress = np.maximum(
+        effective_stress, 0.1
+    )  # Ensure effective stress is at least 0.1
+    m = np.full(effective_stress.shape, m, dtype=np.float64)
+    active = np.ones(effective_stress.shape, dtype=bool)
+
+    for _ in range(CN_MAX_ITERATIONS):
+        qc1n0 = qcn * np.power(10.132 / effective_stress, m)
+        dqc1n0 = (11.9 + qc1n0 / 14.6) * dqc_exp
+
+        qc1ncs0 = qc1n0 + dqc1n0
+        m_new = 1.338 - 0.249 * np.power(qc1ncs0, 0.264)
+
+        # Depths stop updating once their own m value has converged
+        active &= np.abs(m_new - m) > 0.001
+        if not active.any():
+            break
+
+        m = np.where(active, m_new, m)
+
+    return np.minimum(1.7, np.power(100 / effective_stress, m))
 
 
 def calc_qc1ncs(qcn: float, fine_content: float, cn: float) -> float:
@@ -49,16 +137,50 @@ def calc_qc1ncs(qcn: float, fine_content: float, cn: float) -> float:
     - fine_content (float): Fines content percentage.
     - cn (float): Normalized correction factor.
 
+    Returns:
+    - float: The calculated qc1ncs value.
+    """
+    return _calc_qc1ncs(qcn, _dqc_exp_factor(fine_content), cn)
+
+
+@njit(cache=True)
+def _calc_qc1ncs(qcn: float, dqc_exp: float, cn: float) -> float:
+    """
+    Calculate qc1ncs value from a precomputed fines content term.
+
+    Parameters::
+    - qcn (float): Normalized cone tip resistance.
+    - dqc_exp (float): The fines content exponential from `_dqc_exp_factor`.
+    - cn (float): Normalized correction factor.
+
     Returns:
     - float: The calculated qc1ncs value.
     """
     qc1n = cn * qcn
-    dqc1n = (11.9 + qc1n / 14.6) * math.exp(
-        1.63 - (9.7 / (fine_content + 2)) - math.pow(15.7 / (fine_content + 2), 2)
-    )
+    dqc1n = (11.9 + qc1n / 14.6) * dqc_exp
     return max(min(qc1n + dqc1n, 254), 21)
 
 
+def _calc_qc1ncs_array(
+    qcn: np.ndarray, dqc_exp: np.ndarray, cn: np.ndarray
+) -> np.ndarray:
+    """
+    Vectorized counterpart of `_calc_qc1ncs`.
+
+    Parameters::
+    - qcn (np.ndarray): Normalized cone tip resistances.
+    - dqc_exp (np.ndarray): The fines content exponentials from `_dqc_exp_factor`.
+    - cn (np.ndarray): Normalized correction factors.
+
+    Returns:
+    - np.ndarray: The calculated qc1ncs values.
+    """
+    qc1n = cn * qcn
+    dqc1n = (11.9 + qc1n / 14.6) * dqc_exp
+    return np.clip(qc1n + dqc1n, 21, 254)
+
+
+@njit(cache=True)
 def calc_rd(depth: float, mw: float) -> float:
     """
     Calculate rd at a given depth and moment magnitude (Mw).
@@ -78,6 +200,24 @@ def calc_rd(depth: float, mw: float) -> float:
         return 0.12 * math.exp(0.22 * mw)
 
 
+def calc_rd_array(depths: np.ndarray, mw: float) -> np.ndarray:
+    """
+    Calculate rd at each of the given depths for a moment magnitude (Mw).
+
+    Branchless counterpart of `calc_rd` for batches of depths.
+
+    Parameters::
+    - depths (np.ndarray): Depths in meters.
+    - mw (float): Moment magnitude (Mw).
+
+    Returns:
+    - np.ndarray: The calculated rd values.
+    """
+    az = -1.012 - 1.126 * np.sin((depths / 11.73) + 5.133)
+    bz = 0.106 + 0.118 * np.sin((depths / 11.28) + 5.142)
+    return np.where(depths <= 34, np.exp(az + bz * mw), 0.12 * math.exp(0.22 * mw))
+
+
 def calc_msf(mw: float, qc1ncs: float) -> float:
     """
     Calculate MSF (Magnitude Scaling Factor).
@@ -89,10 +229,12 @@ def calc_msf(mw: float, qc1ncs: float) -> float:
     Returns:
     - float: The calculated MSF value.
     """
-    msf_max = min(2.2, 1.09 + math.pow(qc1ncs / 180, 3))
+    q180 = qc1ncs / 180
+    msf_max = min(2.2, 1.09 + q180 * q180 * q180)
     return 1 + (msf_max - 1) * (8.64 * math.exp(-mw / 4) - 1.325)
 
 
+@njit(cache=True)
 def calc_cg(qc1ncs: float) -> float:
     """
     Calculate the Cyclic Stress Ratio (CSR) from qc1ncs value.
@@ -107,6 +249,7 @@ def calc_cg(qc1ncs: float) -> float:
     return min(0.3, cg)
 
 
+@njit(cache=True)
 def calc_kg(cg: float, effective_stress: float) -> float:
     """
     Calculate the stress correction factor (Kg) from effective stress.
@@ -122,6 +265,7 @@ def calc_kg(cg: float, effective_stress: float) -> float:
     return min(1.1, kg)
 
 
+@njit(cache=True)
 def calc_crr(
     kg: float, qc1ncs: float, msf: float, effective_stress
 ) -> Tuple[float, float]:
@@ -137,22 +281,103 @@ def calc_crr(
     Returns:
     - float: The calculated CRR value.
     """
-    crr75 = (
-        kg
-        * math.exp(
-            qc1ncs / 113
-            + (qc1ncs / 1000) ** 2
-            - (qc1ncs / 140) ** 3
-            + (qc1ncs / 137) ** 4
-            - 2.8
-        )
-        * effective_stress
-    )
+    q1k = qc1ncs / 1000
+    q140 = qc1ncs / 140
+    q137 = qc1ncs / 137
+    q137_2 = q137 * q137
+    exponent = qc1ncs / 113 + q1k * q1k - q140 * q140 * q140 + q137_2 * q137_2 - 2.8
+    crr75 = kg * math.exp(exponent) * effective_stress
     crr = msf * crr75
 
     return crr75, crr
 
 
+@njit(cache=True)
+def _analyse_point(
+    depth: float,
+    qcn: float,
+    dqc_exp: float,
+    normal_stress: float,
+    effective_stress: float,
+    MSF: float,
+    pga: float,
+    Mw: float,
+) -> Tuple[float, float, float, float, float, float]:
+    """
+    Run the numeric part of the CPT liquefaction analysis at a single depth.
+
+    Parameters:
+    - depth (float): The depth of the layer.
+    - qcn (float): Normalized cone tip resistance.
+    - dqc_exp (float): The fines content exponential from `_dqc_exp_factor`.
+    - normal_stress (float): The normal stress at the depth.
+    - effective_stress (float): The effective stress at the depth.
+    - MSF (float): The magnitude scaling factor.
+    - pga (float): The peak ground acceleration (in g).
+    - Mw (float): The moment magnitude.
+
+    Returns:
+    - Tuple[float, float, float, float, float, float]: (rd, CSR, CRR75, CRR, safety factor, qc1ncs).
+    """
+    rd = calc_rd(depth, Mw)
+
+    cn = _calc_cn(0.5, qcn, effective_stress, dqc_exp)
+
+    qc1ncs = _calc_qc1ncs(qcn, dqc_exp, cn)
+    cg = calc_cg(qc1ncs)
+    kg = calc_kg(cg, effective_stress)
+
+    csr = hf.calc_csr(pga, normal_stress, rd)
+    crr75, crr = calc_crr(kg, qc1ncs, MSF, effective_stress)
+
+    safety_factor = csr / crr
+
+    return rd, csr, crr75, crr, safety_factor, qc1ncs
+
+
+@njit(cache=True)
+def _calc_cyclic_ratios_array(
+    qc1ncs: np.ndarray,
+    effective_stress: np.ndarray,
+    normal_stress: np.ndarray,
+    rd: np.ndarray,
+    MSF: float,
+    pga: float,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Calculate CSR, CRR and the safety factor for every depth in one block.
+
+    The `calc_cg`, `calc_kg`, `calc_crr` and CSR formulas are written out as a
+    single set of array expressions, so they are evaluated without a Python
+    call per formula (and fused into one loop when Numba is available).
+
+    Parameters:
+    - qc1ncs (np.ndarray): Normalized cone resistance corrected for fine content.
+    - effective_stress (np.ndarray): The effective stresses.
+    - normal_stress (np.ndarray): The normal stresses.
+    - rd (np.ndarray): The stress reduction factors.
+    - MSF (float): The magnitude scaling factor.
+    - pga (float): The peak ground acceleration (in g).
+
+    Returns:
+    - Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]: (CSR, CRR75, CRR, safety factor).
+    """
+    cg = np.minimum(0.3, 1 / (37.3 - 8.27 * qc1ncs**0.264))
+    kg = np.minimum(1.1, 1 - cg * np.log(effective_stress / 101.32))
+
+    q1k = qc1ncs / 1000
+    q140 = qc1ncs / 140
+    q137 = qc1ncs / 137
+    q137_2 = q137 * q137
+    exponent = qc1ncs / 113 + q1k * q1k - q140 * q140 * q140 + q137_2 * q137_2 - 2.8
+    crr75 = kg * np.exp(exponent) * effective_stress
+    crr = MSF * crr75
+
+    csr = 0.65 * pga * normal_stress * rd
+
+    return csr, crr75, crr, csr / crr
+
+
 def analyse_for_layer(
     soil_profile: SoilProfile,
     exp: CPTExp,
@@ -185,24 +410,23 @@ def analyse_for_layer(
         - safetyFactor: The safety factor.
         - settlement: The calculated settlement in cm.
     """
-    rd = calc_rd(depth, Mw)
-    effective_stress = soil_profile.calc_effective_stress(depth)
-    normal_stress = soil_profile.calc_normal_stress(depth)
-
-    soil_layer = soil_profile.get_layer_at_depth(depth)
-
-    cn = calc_cn(0.5, exp.cone_resistance, effective_stress, soil_layer.fine_content)
-
-    qc1ncs = calc_qc1ncs(exp.cone_resistance, soil_layer.fine_content, cn)
-    cg = calc_cg(qc1ncs)
-    kg = calc_kg(cg, effective_stress)
-
-    csr = hf.calc_csr(pga, normal_stress, rd)
-    crr75, crr = calc_crr(kg, qc1ncs, MSF, effective_stress)
-
-    safety_factor = csr / crr
+    soil_layer, normal_stress, effective_stress = soil_profile.layer_and_stresses(depth)
+    hf.check_stresses(pga, normal_stress, effective_stress)
+
+    rd, csr, crr75, crr, safety_factor, qc1ncs = _analyse_point(
+        depth,
+        exp.cone_resistance,
+        _dqc_exp_factor(soil_layer.fine_content),
+        normal_stress,
+        effective_stress,
+        MSF,
+        pga,
+        Mw,
+    )
 
-    is_safe = hf.check_safety(soil_profile, depth, safety_factor, limit_safety_factor)
+    is_safe = hf.check_safety(
+        soil_profile, depth, safety_factor, limit_safety_factor, soil_layer
+    )
 
     settlement = settlement_obj.calc_settlement_via_qci(
         safety_factor, soil_layer.thickness, qc1ncs
@@ -222,28 +446,74 @@ def analyse_for_layer(
 
 
 def analyse_liquefaction(
-    soil_profile: SoilProfile, cpt_log: CPTLog, Mw: float, pga: float
-) -> List:
+    soil_profile: SoilProfile,
+    cpt_log: CPTLog,
+    Mw: float,
+    pga: float,
+    limit_safety_factor=1.1,
+) -> np.ndarray:
     """
     Analyse the soil profile for liquefaction.
 
+    Every depth is evaluated at once with NumPy array operations. The results
+    match calling `analyse_for_layer` for each depth.
+
     Parameters:
     - soil_profile (SoilProfile): The soil profile.
     - cpt_log (CPTLog): The CPT log.
     - Mw (float): The moment magnitude.
     - pga (float): The peak ground acceleration (in g).
+    - limit_safety_factor (float): The safety factor limit.
 
     Returns:
-    - Dict: A dictionary containing the following keys:
-        - safetyFactor: The safety factor.
-        - settlement: The calculated settlement.
+    - np.ndarray: A structured array with dtype `hf.RESULT_DTYPE`, one record per
+      depth with the keys returned by `analyse_for_layer`. Use `hf.as_dicts` to
+      get a list of dictionaries.
     """
     MSF = hf.calc_msf(Mw)
     unique_depths = hf.get_all_depths(soil_profile, cpt_log)
-    results = []
-    for depth in unique_depths:
-        exp = cpt_log.get_exp_at_depth(depth)
-        layer_result = analyse_for_layer(soil_profile, exp, depth, MSF, pga, Mw)
-        results.append(layer_result)
 
-    return results
+    depths = np.asarray(unique_depths, dtype=np.float64)
+    layer_indices = soil_profile.get_layer_indices(depths)
+    qcn = np.array(
+        [cpt_log.get_exp_at_depth(depth).cone_resistance for depth in unique_depths],
+        dtype=np.float64,
+    )
+    fine_content = soil_profile.fine_contents[layer_indices]
+    plasticity = soil_profile.plasticity_indices[layer_indices]
+
+    normal_stress = soil_profile.calc_normal_stress_vec(depths)
+    effective_stress = soil_profile.calc_effective_stress_vec(depths)
+    hf.check_stresses(pga, normal_stress, effective_stress)
+
+    rd = calc_rd_array(depths, Mw)
+
+    dqc_exp = _calc_dqc_exp(fine_content)
+
+    cn = _calc_cn_array(0.5, qcn, effective_stress, dqc_exp)
+    qc1ncs = _calc_qc1ncs_array(qcn, dqc_exp, cn)
+
+    csr, crr75, crr, safety_factor = _calc_cyclic_ratios_array(
+        qc1ncs, effective_stress, normal_stress, rd, MSF, pga
+    )
+
+    is_safe = hf.check_safety_array(
+        soil_profile, depths, safety_factor, limit_safety_factor, plasticity
+    )
+
+    thickness = soil_profile.thicknesses[layer_indices]
+    settlement = settlement_obj.calc_settlement_via_qci_array(
+        safety_factor, thickness, qc1ncs
+    )
+
+    return hf.pack_results(
+        csr,
+        crr75,
+        crr,
+        rd,
+        safety_factor,
+        normal_stress,
+        effective_stress,
+        is_safe,
+        settlement,
+    )
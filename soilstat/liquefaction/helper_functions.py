@@ -1,8 +1,25 @@
-from typing import Union, List
-from soilstat.models.soil_profile import SoilProfile
+from typing import Dict, Optional, Union, List
+import numpy as np
+from soilstat.models.soil_profile import SoilLayer, SoilProfile
 from soilstat.models.CPT import CPTLog
 from soilstat.models.SPT import SPTLog
 from soilstat.models.MASW import MASWLog
+from soilstat._jit import njit
+
+# Column layout of the arrays returned by the vectorized `analyse_liquefaction`
+RESULT_DTYPE = np.dtype(
+    [
+        ("CSR", "f8"),
+        ("CRR75", "f8"),
+        ("CRR", "f8"),
+        ("rd", "f8"),
+        ("safetyFactor", "f8"),
+        ("normalStress", "f8"),
+        ("effectiveStress", "f8"),
+        ("is_safe", "?"),
+        ("settlement", "f8"),
+    ]
+)
 
 
 def calc_msf(Mw: float) -> float:
@@ -18,6 +35,7 @@ def calc_msf(Mw: float) -> float:
     return (10**2.24) / (Mw**2.56)
 
 
+@njit(cache=True)
 def calc_rd(depth: float) -> float:
     """
     Calculates the reduction factor (rd) at a given depth.
@@ -38,6 +56,31 @@ def calc_rd(depth: float) -> float:
         return 0.5
 
 
+@njit(cache=True)
+def calc_rd_array(depths: np.ndarray) -> np.ndarray:
+    """
+    Calculates the reduction factor (rd) at each of the given depths.
+
+    Branchless counterpart of `calc_rd` for batches of depths.
+
+    Parameters:
+    - depths (np.ndarray): The depths (in meters).
+
+    Returns:
+    - np.ndarray: The reduction factor (rd) at each depth.
+    """
+    return np.where(
+        depths <= 9.15,
+        1 - 0.00765 * depths,
+        np.where(
+            depths < 23,
+            1.174 - 0.0267 * depths,
+            np.where(depths < 30, 0.744 - 0.008 * depths, 0.5),
+        ),
+    )
+
+
+@njit(cache=True)
 def calc_csr(pga: float, normal_stress: float, rd: float) -> float:
     """
     Calculate the cyclic stress ratio (CSR) based on the given parameters.
@@ -53,11 +96,43 @@ def calc_csr(pga: float, normal_stress: float, rd: float) -> float:
     return 0.65 * pga * normal_stress * rd
 
 
+def check_stresses(
+    pga: float,
+    normal_stress: Union[float, np.ndarray],
+    effective_stress: Union[float, np.ndarray],
+) -> None:
+    """
+    Check that the liquefaction methods can be evaluated at the given stresses.
+
+    The compiled kernels return inf or NaN where the pure Python ones raise, so
+    the inputs are checked here before either is called.
+
+    Parameters:
+    - pga (float): The peak ground acceleration.
+    - normal_stress (Union[float, np.ndarray]): The normal stress at each depth.
+    - effective_stress (Union[float, np.ndarray]): The effective stress at each depth.
+
+    Raises:
+    - ZeroDivisionError: If pga or any of the normal stresses is zero, as the CSR
+      is then zero and the safety factor is undefined.
+    - ValueError: If any of the effective stresses is not positive, which happens
+      when the groundwater level is above the ground surface.
+    """
+    if pga == 0 or np.any(np.asarray(normal_stress) == 0):
+        raise ZeroDivisionError(
+            "The cyclic stress ratio is zero, so the safety factor is undefined."
+        )
+
+    if np.any(np.asarray(effective_stress) <= 0):
+        raise ValueError("The effective stress should be positive.")
+
+
 def check_safety(
     soil_profile: SoilProfile,
     depth: float,
     safety_factor: float,
     limit_safety_factor: float,
+    layer: Optional[SoilLayer] = None,
 ) -> bool:
     """
     Check if the soil profile is safe at a given depth.
@@ -67,17 +142,48 @@ def check_safety(
     - depth (float): The depth (in meters).
     - safety_factor (float): The safety factor.
     - limit_safety_factor (float): The limit safety factor.
+    - layer (Optional[SoilLayer]): The soil layer at the depth, if the caller already resolved it.
 
     Returns:
     - bool: True if there is no liquefaction risk in the layer, False otherwise.
     """
-    gwt = soil_profile.ground_water_level
-    layer = soil_profile.get_layer_at_depth(depth)
-    plasticity = layer.plasticity_index
+    if safety_factor >= limit_safety_factor:
+        return True
+
+    if soil_profile.ground_water_level > depth:
+        return True
+
+    if layer is None:
+        layer = soil_profile.get_layer_at_depth(depth)
+
+    return layer.plasticity_index > 12
+
+
+def check_safety_array(
+    soil_profile: SoilProfile,
+    depths: np.ndarray,
+    safety_factor: np.ndarray,
+    limit_safety_factor: float,
+    plasticity_index: np.ndarray,
+) -> np.ndarray:
+    """
+    Check if the soil profile is safe at each of the given depths.
 
-    is_safe = safety_factor >= limit_safety_factor or gwt > depth or plasticity > 12
+    Parameters:
+    - soil_profile (SoilProfile): The soil profile.
+    - depths (np.ndarray): The depths (in meters).
+    - safety_factor (np.ndarray): The safety factors at the depths.
+    - limit_safety_factor (float): The limit safety factor.
+    - plasticity_index (np.ndarray): The plasticity index of the layer at each depth.
 
-    return is_safe
+    Returns:
+    - np.ndarray: A boolean array, True where there is no liquefaction risk.
+    """
+    return (
+        (safety_factor >= limit_safety_factor)
+        | (soil_profile.ground_water_level > depths)
+        | (plasticity_index > 12)
+    )
 
 
 def get_all_depths(
@@ -93,7 +199,66 @@ def get_all_depths(
     Returns:
     - List[float]: A list of all the unique depths from the soil profile and the experiment log.
     """
-    layer_depths = [layer.depth for layer in soil_profile.layers]
-    exp_depths = [exp.depth for exp in exp_log.exps]
+    return sorted(
+        {
+            *(layer.depth for layer in soil_profile.layers),
+            *(exp.depth for exp in exp_log.exps),
+        }
+    )
+
+
+def pack_results(
+    csr: np.ndarray,
+    crr75: np.ndarray,
+    crr: np.ndarray,
+    rd: np.ndarray,
+    safety_factor: np.ndarray,
+    normal_stress: np.ndarray,
+    effective_stress: np.ndarray,
+    is_safe: np.ndarray,
+    settlement: np.ndarray,
+) -> np.ndarray:
+    """
+    Pack the per-depth result columns into a single structured array.
+
+    Parameters:
+    - csr (np.ndarray): The cyclic stress ratios.
+    - crr75 (np.ndarray): The cyclic resistance ratios for 7.5 magnitude.
+    - crr (np.ndarray): The cyclic resistance ratios.
+    - rd (np.ndarray): The reduction factors.
+    - safety_factor (np.ndarray): The safety factors.
+    - normal_stress (np.ndarray): The normal stresses.
+    - effective_stress (np.ndarray): The effective stresses.
+    - is_safe (np.ndarray): Whether each depth is safe against liquefaction.
+    - settlement (np.ndarray): The calculated settlements in cm.
+
+    Returns:
+    - np.ndarray: An array with dtype `RESULT_DTYPE`, one record per depth.
+    """
+    results = np.empty(len(csr), dtype=RESULT_DTYPE)
+    results["CSR"] = csr
+    results["CRR75"] = crr75
+    results["CRR"] = crr
+    results["rd"] = rd
+    results["safetyFactor"] = safety_factor
+    results["normalStress"] = normal_stress
+    results["effectiveStress"] = effective_stress
+    results["is_safe"] = is_safe
+    results["settlement"] = settlement
+
+    return results
+
+
+def as_dicts(results: np.ndarray) -> List[Dict[str, float]]:
+    """
+    Convert a result array of `analyse_liquefaction` to a list of dictionaries.
+
+    Parameters:
+    - results (np.ndarray): An array with dtype `RESULT_DTYPE`.
+
+    Returns:
+    - List[Dict[str, float]]: One dictionary per depth, keyed by the column names.
+    """
+    names = results.dtype.names
 
-    return sorted(list(set(layer_depths + exp_depths)))
+    return [dict(zip(names, row)) for row in results.tolist()]
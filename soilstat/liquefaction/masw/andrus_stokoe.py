@@ -1,6 +1,8 @@
+import math
+import numpy as np
 from soilstat.models.MASW import MASWExp, MASWLog
 from soilstat.models.soil_profile import SoilProfile, SoilLayer
-from typing import Dict, Tuple, List
+from typing import Dict, Tuple
 import soilstat.liquefaction.helper_functions as hf
 from soilstat.liquefaction.settlement import settlement_obj
 
@@ -21,8 +23,9 @@ def calc_crr(
         - crr75: The cyclic resistance ratio for 7.5 Magnitude of earthquake.
         - crr: The cyclic resistance ratio.
     """
+    vs1_100 = vs1 / 100
     crr75 = effective_stress * (
-        0.03 * (vs1 / 100) ** 2 + 0.09 * (vs1c - vs1) - 0.09 / vs1c
+        0.03 * vs1_100 * vs1_100 + 0.09 * (vs1c - vs1) - 0.09 / vs1c
     )
     crr = crr75 * MSF
 
@@ -52,6 +55,23 @@ def calc_vs1c(fine_content: float) -> float:
         return 200
 
 
+def calc_vs1c_array(fine_content: np.ndarray) -> np.ndarray:
+    """
+    Calculate `VS1c` for an array of fine content percentages.
+
+    Parameters:
+    - fine_content (np.ndarray): The percentages of fine content.
+
+    Returns:
+    - np.ndarray: The calculated `VS1c` values, same as `calc_vs1c` element-wise.
+    """
+    return np.where(
+        fine_content <= 5,
+        215.0,
+        np.where(fine_content <= 35, 215.0 - 0.5 * (fine_content - 5.0), 200.0),
+    )
+
+
 def calc_cn(effective_stress: float) -> float:
     """
     Calculate the value of `CN` based on the effective stress.
@@ -62,7 +82,20 @@ def calc_cn(effective_stress: float) -> float:
     Returns:
     - float: The calculated value of `CN`.
     """
-    return min(1.7, 3.16 * (1 / effective_stress) ** 0.5)
+    return min(1.7, 3.16 / math.sqrt(effective_stress))
+
+
+def calc_cn_array(effective_stress: np.ndarray) -> np.ndarray:
+    """
+    Calculate `CN` for an array of effective stresses.
+
+    Parameters:
+    - effective_stress (np.ndarray): The effective stresses.
+
+    Returns:
+    - np.ndarray: The calculated values of `CN`.
+    """
+    return np.minimum(1.7, 3.16 / np.sqrt(effective_stress))
 
 
 def analyse_for_layer(
@@ -94,15 +127,13 @@ def analyse_for_layer(
         - safetyFactor: The safety factor.
         - settlement: The calculated settlement in cm.
     """
-    soil_layer = soil_profile.get_layer_at_depth(depth)
+    soil_layer, normal_stress, effective_stress = soil_profile.layer_and_stresses(depth)
+    hf.check_stresses(pga, normal_stress, effective_stress)
     fine_content = soil_layer.fine_content
     vs = exp.shear_wave_velocity
 
     rd = hf.calc_rd(soil_layer.depth)
 
-    effective_stress = soil_profile.calc_effective_stress(depth)
-    normal_stress = soil_profile.calc_normal_stress(depth)
-
     cn = calc_cn(effective_stress)
     vs1c = calc_vs1c(fine_content)
 
@@ -126,7 +157,9 @@ def analyse_for_layer(
     crr75, crr = calc_crr(vs1, vs1c, effective_stress, MSF)
     safety_factor = crr / csr
 
-    is_safe = hf.check_safety(soil_profile, depth, safety_factor, limit_safety_factor)
+    is_safe = hf.check_safety(
+        soil_profile, depth, safety_factor, limit_safety_factor, soil_layer
+    )
     settlement = settlement_obj.calc_settlement_via_vs1c(
         safety_factor, soil_layer.thickness, vs1c
     )
@@ -145,28 +178,85 @@ def analyse_for_layer(
 
 
 def analyse_liquefaction(
-    soil_profile: SoilProfile, masw_log: MASWLog, Mw: float, pga: float
-) -> List:
+    soil_profile: SoilProfile,
+    masw_log: MASWLog,
+    Mw: float,
+    pga: float,
+    limit_safety_factor=1.1,
+) -> np.ndarray:
     """
     Analyse the soil profile for liquefaction.
 
+    Every depth is evaluated at once with NumPy array operations. The results
+    match calling `analyse_for_layer` for each depth.
+
     Parameters:
     - soil_profile (SoilProfile): The soil profile.
     - masw_log (MASWLog): The MASW log.
     - Mw (float): The moment magnitude.
     - pga (float): The peak ground acceleration (in g).
+    - limit_safety_factor (float): The safety factor limit.
 
     Returns:
-    - Dict: A dictionary containing the following keys:
-        - safetyFactor: The safety factor.
-        - settlement: The calculated settlement.
+    - np.ndarray: A structured array with dtype `hf.RESULT_DTYPE`, one record per
+      depth with the keys returned by `analyse_for_layer`. Use `hf.as_dicts` to
+      get a list of dictionaries.
     """
     MSF = hf.calc_msf(Mw)
     unique_depths = hf.get_all_depths(soil_profile, masw_log)
-    results = []
-    for depth in unique_depths:
-        exp = masw_log.get_exp_at_depth(depth)
-        layer_result = analyse_for_layer(soil_profile, exp, depth, MSF, pga)
-        results.append(layer_result)
 
-    return results
+    depths = np.asarray(unique_depths, dtype=np.float64)
+    layer_indices = soil_profile.get_layer_indices(depths)
+    vs = np.array(
+        [
+            masw_log.get_exp_at_depth(depth).shear_wave_velocity
+            for depth in unique_depths
+        ],
+        dtype=np.float64,
+    )
+    plasticity = soil_profile.plasticity_indices[layer_indices]
+
+    normal_stress = soil_profile.calc_normal_stress_vec(depths)
+    effective_stress = soil_profile.calc_effective_stress_vec(depths)
+    hf.check_stresses(pga, normal_stress, effective_stress)
+
+    rd = hf.calc_rd_array(soil_profile.layer_bottoms[layer_indices])
+    fine_content = soil_profile.fine_contents[layer_indices]
+    vs1c = calc_vs1c_array(fine_content)
+
+    cn = calc_cn_array(effective_stress)
+    vs1 = vs * cn
+
+    csr = hf.calc_csr(pga, normal_stress, rd)
+    crr75, crr = calc_crr(vs1, vs1c, effective_stress, MSF)
+    safety_factor = crr / csr
+
+    # A corrected shear wave velocity above the limit cannot liquefy
+    liquefiable = vs1 < vs1c
+
+    crr75 = np.where(liquefiable, crr75, 0)
+    crr = np.where(liquefiable, crr, 0)
+    safety_factor = np.where(liquefiable, safety_factor, 0)
+
+    is_safe = ~liquefiable | hf.check_safety_array(
+        soil_profile, depths, safety_factor, limit_safety_factor, plasticity
+    )
+
+    thickness = soil_profile.thicknesses[layer_indices]
+    settlement = np.where(
+        liquefiable,
+        settlement_obj.calc_settlement_via_vs1c_array(safety_factor, thickness, vs1c),
+        0,
+    )
+
+    return hf.pack_results(
+        csr,
+        crr75,
+        crr,
+        rd,
+        safety_factor,
+        normal_stress,
+        effective_stress,
+        is_safe,
+        settlement,
+    )
@@ -1,8 +1,80 @@
 import math
 import numpy as np
+from soilstat._jit import njit
+
+
+@njit(cache=True)
+def _volumetric_strain(
+    corrected_tip_resistance: float,
+    safety_factor: float,
+    a0: float,
+    a1: float,
+    a2: float,
+    a3: float,
+    b0: float,
+    b1: float,
+    b2: float,
+) -> float:
+    """
+    Calculate the volumetric strain from the settlement curve coefficients.
+
+    Parameters:
+    - corrected_tip_resistance (float): The corrected tip resistance.
+    - safety_factor (float): The safety factor.
+    - a0, a1, a2, a3, b0, b1, b2 (float): The coefficients of the settlement curves.
+
+    Returns:
+    - float: The calculated volumetric strain.
+    """
+    if safety_factor > 2:
+        return 0.0
+
+    log_q = math.log(corrected_tip_resistance)
+    s2 = b0 + b1 * log_q + b2 * log_q * log_q
+    denom_term = a2 + a3 * log_q
+
+    if (2 - 1 / denom_term) < safety_factor < 2:
+        s1 = (a0 + a1 * log_q) / ((1 / (2 - safety_factor)) - denom_term)
+        unit_deformation = min(s1, s2)
+    else:
+        unit_deformation = s2
+
+    return unit_deformation
+
+
+def _volumetric_strain_array(
+    corrected_tip_resistance: np.ndarray,
+    safety_factor: np.ndarray,
+    a0: float,
+    a1: float,
+    a2: float,
+    a3: float,
+    b0: float,
+    b1: float,
+    b2: float,
+) -> np.ndarray:
+    """
+    Calculate the volumetric strain for arrays of tip resistances and safety factors.
+
+    Evaluates the same branches as `_volumetric_strain` with `np.where`.
+    """
+    log_q = np.log(corrected_tip_resistance)
+    s2 = b0 + b1 * log_q + b2 * log_q * log_q
+    denom_term = a2 + a3 * log_q
+
+    # s1 is only used strictly between the lower bound and 2, where 2 - sf > 0
+    with np.errstate(divide="ignore", invalid="ignore"):
+        s1 = (a0 + a1 * log_q) / ((1 / (2 - safety_factor)) - denom_term)
+        use_s1 = ((2 - 1 / denom_term) < safety_factor) & (safety_factor < 2)
+
+    unit_deformation = np.where(use_s1, np.minimum(s1, s2), s2)
+
+    return np.where(safety_factor > 2, 0.0, unit_deformation)
 
 
 class LiquefactionSettlement:
+    __slots__ = ()
+
     a0 = 0.3773
     a1 = -0.0337
     a2 = 1.5672
@@ -14,6 +86,16 @@ class LiquefactionSettlement:
     q_list = [33, 45, 60, 80, 147, 200]
     n90_list = [3, 6, 10, 14, 25, 30]
     relative_densities = [30, 40, 50, 60, 70, 80, 90]
+    relative_density_q_list = [33, 45, 60, 80, 110, 147, 200]
+
+    # Interpolation tables converted once, so np.interp does not rebuild them
+    _q_arr = np.array(q_list, dtype=np.float64)
+    _n90_arr = np.array(n90_list, dtype=np.float64)
+    _dr_arr = np.array(relative_densities, dtype=np.float64)
+    _dr_q_arr = np.array(relative_density_q_list, dtype=np.float64)
+
+    # QCI for every integer N90 in the table range, indexed by n90 - 3
+    _n90_q_table = tuple(np.interp(np.arange(3, 31), _n90_arr, _q_arr).tolist())
 
     def n90_to_qci(self, n90: int) -> float:
         """
@@ -25,7 +107,11 @@ class LiquefactionSettlement:
         Returns:
         - float: The QCI value.
         """
-        qci = np.interp(n90, self.n90_list, self.q_list)[0]
+        if float(n90).is_integer():
+            # np.interp clamps to the ends of the table, so the index is clamped too
+            return self._n90_q_table[min(max(int(n90), 3), 30) - 3]
+
+        qci = float(np.interp(n90, self._n90_arr, self._q_arr))
         return qci
 
     @staticmethod
@@ -51,7 +137,7 @@ class LiquefactionSettlement:
         Returns:
         - float: The QCI value.
         """
-        qci = np.interp(relative_density, self.relative_densities, self.q_list)[0]
+        qci = float(np.interp(relative_density, self._dr_arr, self._dr_q_arr))
 
         return qci
 
@@ -68,32 +154,42 @@ class LiquefactionSettlement:
         Returns:
         - float: The calculated volumetric strain.
         """
+        return _volumetric_strain(
+            corrected_tip_resistance,
+            safety_factor,
+            self.a0,
+            self.a1,
+            self.a2,
+            self.a3,
+            self.b0,
+            self.b1,
+            self.b2,
+        )
+
+    def calc_volumetric_strain_array(
+        self, corrected_tip_resistance: np.ndarray, safety_factor: np.ndarray
+    ) -> np.ndarray:
+        """
+        Calculate the volumetric strain for arrays of tip resistances and safety factors.
 
-        if safety_factor > 2:
-            unit_deformation = 0
-        elif (
-            (2 - 1 / (self.a2 + self.a3 * math.log(corrected_tip_resistance)))
-            < safety_factor
-            < 2
-        ):
-            s1 = (self.a0 + self.a1 * math.log(corrected_tip_resistance)) / (
-                (1 / (2 - safety_factor))
-                - (self.a2 + self.a3 * math.log(corrected_tip_resistance))
-            )
-            s2 = (
-                self.b0
-                + self.b1 * math.log(corrected_tip_resistance)
-                + self.b2 * math.pow(math.log(corrected_tip_resistance), 2)
-            )
-            unit_deformation = min(s1, s2)
-        else:
-            unit_deformation = (
-                self.b0
-                + self.b1 * math.log(corrected_tip_resistance)
-                + self.b2 * math.pow(math.log(corrected_tip_resistance), 2)
-            )
-
-        return unit_deformation
+        Parameters:
+        - corrected_tip_resistance (np.ndarray): The corrected tip resistances.
+        - safety_factor (np.ndarray): The safety factors.
+
+        Returns:
+        - np.ndarray: The calculated volumetric strains.
+        """
+        return _volumetric_strain_array(
+            np.asarray(corrected_tip_resistance, dtype=np.float64),
+            np.asarray(safety_factor, dtype=np.float64),
+            self.a0,
+            self.a1,
+            self.a2,
+            self.a3,
+            self.b0,
+            self.b1,
+            self.b2,
+        )
 
     def calc_settlement_via_n90(
         self, safety_factor: float, layer_thickness: float, n90: int
@@ -156,5 +252,67 @@ class LiquefactionSettlement:
 
         return settlement * layer_thickness
 
+    def calc_settlement_via_n90_array(
+        self, safety_factor: np.ndarray, layer_thickness: np.ndarray, n90: np.ndarray
+    ) -> np.ndarray:
+        """
+        Calculate the settlements based on arrays of N90 values.
+
+        Parameters:
+        - safety_factor (np.ndarray): The safety factors.
+        - layer_thickness (np.ndarray): The thicknesses of the layers.
+        - n90 (np.ndarray): The N90 values.
+
+        Returns:
+        - np.ndarray: The calculated settlements in meters.
+        """
+        n90 = np.trunc(np.clip(np.asarray(n90, dtype=np.float64), 3, 30))
+        qci = np.interp(n90, self._n90_arr, self._q_arr)
+        settlement = self.calc_volumetric_strain_array(qci, safety_factor)
+
+        return settlement * layer_thickness
+
+    def calc_settlement_via_vs1c_array(
+        self, safety_factor: np.ndarray, layer_thickness: np.ndarray, vs1c: np.ndarray
+    ) -> np.ndarray:
+        """
+        Calculate the settlements based on arrays of VS1c values.
+
+        Parameters:
+        - safety_factor (np.ndarray): The safety factors.
+        - layer_thickness (np.ndarray): The thicknesses of the layers.
+        - vs1c (np.ndarray): The values of `VS1c`.
+
+        Returns:
+        - np.ndarray: The calculated settlements in meters.
+        """
+        relative_density = self.calc_relative_density(
+            np.asarray(vs1c, dtype=np.float64)
+        )
+        relative_density = np.clip(relative_density, 30, 90)
+
+        qci = np.interp(relative_density, self._dr_arr, self._dr_q_arr)
+        settlement = self.calc_volumetric_strain_array(qci, safety_factor)
+
+        return settlement * layer_thickness
+
+    def calc_settlement_via_qci_array(
+        self, safety_factor: np.ndarray, layer_thickness: np.ndarray, qci: np.ndarray
+    ) -> np.ndarray:
+        """
+        Calculate the settlements based on arrays of QCI values.
+
+        Parameters:
+        - safety_factor (np.ndarray): The safety factors.
+        - layer_thickness (np.ndarray): The thicknesses of the layers.
+        - qci (np.ndarray): The QCI values.
+
+        Returns:
+        - np.ndarray: The calculated settlements in meters.
+        """
+        settlement = self.calc_volumetric_strain_array(qci, safety_factor)
+
+        return settlement * layer_thickness
+
 
 settlement_obj = LiquefactionSettlement()
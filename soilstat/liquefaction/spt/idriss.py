@@ -1,10 +1,13 @@
+import numpy as np
 from soilstat.models.SPT import SPTLog, SPTExp
 from soilstat.models.soil_profile import SoilProfile
-from typing import Dict, List
+from typing import Dict, Tuple
 import soilstat.liquefaction.helper_functions as hf
 from soilstat.liquefaction.settlement import settlement_obj
+from soilstat._jit import njit
 
 
+@njit(cache=True)
 def calc_crr(effective_stress: float, n160f: float, MSF: float):
     """
     Calculate the cyclic resistance ratio.
@@ -19,8 +22,9 @@ def calc_crr(effective_stress: float, n160f: float, MSF: float):
         - crr75: The cyclic resistance ratio for 7.5 Magnitude of earthquake.
         - crr: The cyclic resistance ratio.
     """
+    n160f_term = 10 * n160f + 45
     crr75 = effective_stress * (
-        (1 / (34 - n160f)) + (n160f / 135) + (50 / ((10 * n160f + 45) ** 2)) - 0.005
+        (1 / (34 - n160f)) + (n160f / 135) + (50 / (n160f_term * n160f_term)) - 0.005
     )
 
     crr = crr75 * MSF
@@ -28,6 +32,71 @@ def calc_crr(effective_stress: float, n160f: float, MSF: float):
     return crr75, crr
 
 
+@njit(cache=True)
+def _analyse_point(
+    depth: float,
+    n160f: float,
+    normal_stress: float,
+    effective_stress: float,
+    MSF: float,
+    pga: float,
+) -> Tuple[float, float, float, float, float]:
+    """
+    Run the numeric part of the SPT liquefaction analysis at a single depth.
+
+    Parameters:
+    - depth (float): The depth of the experiment.
+    - n160f (float): The corrected N160 value.
+    - normal_stress (float): The normal stress at the depth.
+    - effective_stress (float): The effective stress at the depth.
+    - MSF (float): The magnitude scaling factor.
+    - pga (float): The peak ground acceleration (in g).
+
+    Returns:
+    - Tuple[float, float, float, float, float]: (rd, CSR, CRR75, CRR, safety factor).
+    """
+    rd = hf.calc_rd(depth)
+    csr = hf.calc_csr(pga, normal_stress, rd)
+    crr75, crr = calc_crr(effective_stress, n160f, MSF)
+
+    return rd, csr, crr75, crr, crr / csr
+
+
+@njit(cache=True, parallel=True, error_model="numpy")
+def _analyse_points(
+    depths: np.ndarray,
+    n160f: np.ndarray,
+    normal_stress: np.ndarray,
+    effective_stress: np.ndarray,
+    MSF: float,
+    pga: float,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Run the numeric part of the SPT liquefaction analysis for every depth at once.
+
+    Array counterpart of `_analyse_point`. With Numba the array expressions are
+    fused into one loop that is split across the available cores. A zero CSR
+    would give an infinite safety factor instead of raising, so callers have to
+    reject it before calling this.
+
+    Parameters:
+    - depths (np.ndarray): The depths of the experiments.
+    - n160f (np.ndarray): The corrected N160 values.
+    - normal_stress (np.ndarray): The normal stresses at the depths.
+    - effective_stress (np.ndarray): The effective stresses at the depths.
+    - MSF (float): The magnitude scaling factor.
+    - pga (float): The peak ground acceleration (in g).
+
+    Returns:
+    - Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]: (rd, CSR, CRR75, CRR, safety factor).
+    """
+    rd = hf.calc_rd_array(depths)
+    csr = hf.calc_csr(pga, normal_stress, rd)
+    crr75, crr = calc_crr(effective_stress, n160f, MSF)
+
+    return rd, csr, crr75, crr, crr / csr
+
+
 def analyse_for_layer(
     soil_profile: SoilProfile,
     exp: SPTExp,
@@ -62,23 +131,19 @@ def analyse_for_layer(
     n160f = exp.n160f
     n160 = exp.n160
 
-    rd = hf.calc_rd(depth)
-    effective_stress = soil_profile.calc_effective_stress(depth)
-    normal_stress = soil_profile.calc_normal_stress(depth)
-
-    csr = hf.calc_csr(pga, normal_stress, rd)
+    layer, normal_stress, effective_stress = soil_profile.layer_and_stresses(depth)
 
     if n160f >= 34:
         raise ValueError("The corrected N160 value should be less than 34.")
 
-    crr75, crr = calc_crr(effective_stress, n160f, MSF)
-
-    safety_factor = crr / csr
+    hf.check_stresses(pga, normal_stress, effective_stress)
 
-    layer = soil_profile.get_layer_at_depth(depth)
+    rd, csr, crr75, crr, safety_factor = _analyse_point(
+        depth, n160f, normal_stress, effective_stress, MSF, pga
+    )
 
     is_safe = (
-        hf.check_safety(soil_profile, depth, safety_factor, limit_safety_factor)
+        hf.check_safety(soil_profile, depth, safety_factor, limit_safety_factor, layer)
         or n160 >= 30
         or n160f >= 34
     )
@@ -101,28 +166,78 @@ def analyse_for_layer(
 
 
 def analyse_liquefaction(
-    soil_profile: SoilProfile, spt_log: SPTLog, Mw: float, pga: float
-) -> List:
+    soil_profile: SoilProfile,
+    spt_log: SPTLog,
+    Mw: float,
+    pga: float,
+    limit_safety_factor=1.1,
+) -> np.ndarray:
     """
     Analyse the soil profile for liquefaction.
 
+    Every depth is evaluated at once with NumPy array operations. The results
+    match calling `analyse_for_layer` for each depth.
+
     Parameters:
     - soil_profile (SoilProfile): The soil profile.
     - spt_log (SPTLog): The corrected SPT log.
     - Mw (float): The moment magnitude.
     - pga (float): The peak ground acceleration (in g).
+    - limit_safety_factor (float): The safety factor limit.
 
     Returns:
-    - Dict: A dictionary containing the following keys:
-        - safetyFactor: The safety factor.
-        - settlement: The calculated settlement.
+    - np.ndarray: A structured array with dtype `hf.RESULT_DTYPE`, one record per
+      depth with the keys returned by `analyse_for_layer`. Use `hf.as_dicts` to
+      get a list of dictionaries.
     """
     MSF = hf.calc_msf(Mw)
     unique_depths = hf.get_all_depths(soil_profile, spt_log)
-    results = []
-    for depth in unique_depths:
-        exp = spt_log.get_exp_at_depth(depth)
-        layer_result = analyse_for_layer(soil_profile, exp, depth, MSF, pga)
-        results.append(layer_result)
 
-    return results
+    # Each depth is evaluated at the depth of its SPT experiment, so depths that
+    # resolve to the same experiment are evaluated once and share the result
+    exp_indices, rows = np.unique(
+        spt_log.get_exp_indices(unique_depths), return_inverse=True
+    )
+
+    depths = spt_log.exp_depths[exp_indices]
+    n160 = spt_log.n160_values[exp_indices]
+    n160f = spt_log.n160f_values[exp_indices]
+
+    if np.any(n160f >= 34):
+        raise ValueError("The corrected N160 value should be less than 34.")
+
+    layer_indices = soil_profile.get_layer_indices(depths)
+    plasticity = soil_profile.plasticity_indices[layer_indices]
+
+    normal_stress = soil_profile.calc_normal_stress_vec(depths)
+    effective_stress = soil_profile.calc_effective_stress_vec(depths)
+
+    hf.check_stresses(pga, normal_stress, effective_stress)
+
+    rd, csr, crr75, crr, safety_factor = _analyse_points(
+        depths, n160f, normal_stress, effective_stress, MSF, pga
+    )
+
+    is_safe = hf.check_safety_array(
+        soil_profile, depths, safety_factor, limit_safety_factor, plasticity
+    ) | (n160 >= 30)
+
+    thickness = soil_profile.thicknesses[layer_indices]
+    n90 = spt_log.n90_values[exp_indices]
+    settlement = settlement_obj.calc_settlement_via_n90_array(
+        safety_factor, thickness, n90
+    )
+
+    results = hf.pack_results(
+        csr,
+        crr75,
+        crr,
+        rd,
+        safety_factor,
+        normal_stress,
+        effective_stress,
+        is_safe,
+        settlement,
+    )
+
+    return results[rows]
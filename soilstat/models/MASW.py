@@ -1,6 +1,10 @@
 from dataclasses import dataclass, field
 from typing import List
 
+import numpy as np
+
+from soilstat.models._exp_lookup import first_at_or_below, is_ordered
+
 
 @dataclass
 class MASWExp:
@@ -13,10 +17,15 @@ class MASWLog:
 
     def __init__(self, exps: List[MASWExp]):
         self.exps = exps
+        self._exp_depth_arr = np.fromiter(
+            (exp.depth for exp in exps), dtype=np.float64, count=len(exps)
+        )
+        self._exps_ordered = is_ordered(self._exp_depth_arr)
 
     def get_exp_at_depth(self, depth: float) -> MASWExp:
-        for i, exp in enumerate(self.exps):
-            if exp.depth >= depth:
-                return self.exps[i - 1]
+        # Index of the first experiment at or below the depth. The experiment
+        # before it is returned, which wraps to the last one when i is 0 or
+        # when every experiment is shallower than the depth
+        i = int(first_at_or_below(self._exp_depth_arr, self._exps_ordered, depth))
 
-        return self.exps[-1]
+        return self.exps[i - 1]
@@ -1,6 +1,9 @@
 from dataclasses import dataclass, field
 from typing import List
 
+import numpy as np
+
+from soilstat.models._exp_lookup import first_at_or_below, is_ordered
 from soilstat.models.soil_profile import SoilLayer
 
 
@@ -41,6 +44,12 @@ class SPTLog:
         sampler_correction_factor: float = 0,
     ):
         self.exps = exps
+        self._exp_depth_arr = self._column("depth")
+        self._exps_ordered = is_ordered(self._exp_depth_arr)
+        self._n_arr = self._column("n")
+        self._n160_arr = self._column("n160")
+        self._n160f_arr = self._column("n160f")
+        self._n90_arr = self._column("n90")
         self.energy_correction_factor = energy_correction_factor
         self.diameter_correction_factor = diameter_correction_factor
         self.sampler_correction_factor = sampler_correction_factor
@@ -50,7 +59,48 @@ class SPTLog:
         """
         Calculates the average N value for the SPT experiments.
         """
-        return int(sum(exp.n for exp in self.exps) / len(self.exps))
+        return int(self._n_arr.mean())
+
+    def _column(self, name: str) -> np.ndarray:
+        """
+        Returns the given field of every experiment as a float array.
+        """
+        values = np.fromiter(
+            (getattr(exp, name) for exp in self.exps),
+            dtype=np.float64,
+            count=len(self.exps),
+        )
+        # The columns are shared through the read-only properties below
+        values.flags.writeable = False
+        return values
+
+    @property
+    def exp_depths(self) -> np.ndarray:
+        """
+        The depth of every experiment, as a read-only array.
+        """
+        return self._exp_depth_arr
+
+    @property
+    def n160_values(self) -> np.ndarray:
+        """
+        The N160 value of every experiment, as a read-only array.
+        """
+        return self._n160_arr
+
+    @property
+    def n160f_values(self) -> np.ndarray:
+        """
+        The N160f value of every experiment, as a read-only array.
+        """
+        return self._n160f_arr
+
+    @property
+    def n90_values(self) -> np.ndarray:
+        """
+        The N90 value of every experiment, as a read-only array.
+        """
+        return self._n90_arr
 
     def correct_n(self, n: int, depth: float, soil_layer: SoilLayer) -> int:
         """
@@ -60,8 +110,18 @@ class SPTLog:
         return 0
 
     def get_exp_at_depth(self, depth: float) -> SPTExp:
-        for i, exp in enumerate(self.exps):
-            if exp.depth >= depth:
-                return self.exps[i - 1]
+        # Index of the first experiment at or below the depth. The experiment
+        # before it is returned, which wraps to the last one when i is 0 or
+        # when every experiment is shallower than the depth
+        i = int(first_at_or_below(self._exp_depth_arr, self._exps_ordered, depth))
+
+        return self.exps[i - 1]
+
+    def get_exp_indices(self, depths: np.ndarray) -> np.ndarray:
+        """
+        Returns the index of the experiment `get_exp_at_depth` returns for each of the depths.
+        """
+        i = first_at_or_below(self._exp_depth_arr, self._exps_ordered, depths)
 
-        return self.exps[-1]
+        # Same wrap around as indexing the list with i - 1
+        return (i - 1) % len(self.exps)
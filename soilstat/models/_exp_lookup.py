@@ -0,0 +1,30 @@
+"""
+Depth lookups shared by the CPT, MASW and SPT logs.
+"""
+
+import numpy as np
+
+
+def is_ordered(exp_depths: np.ndarray) -> bool:
+    """
+    Returns True if the experiment depths are in ascending order.
+    """
+    return bool(np.all(exp_depths[1:] >= exp_depths[:-1]))
+
+
+def first_at_or_below(exp_depths: np.ndarray, ordered: bool, depths):
+    """
+    Returns the index of the first experiment, in list order, whose depth is at or
+    below each of the depths, or the number of experiments when there is none.
+
+    Ordered logs are resolved with a binary search. Other logs fall back to the
+    equivalent scan over the experiments in the order they were given.
+    """
+    if ordered:
+        return np.searchsorted(exp_depths, depths, side="left")
+
+    at_or_below = np.asarray(depths, dtype=np.float64)[..., None] <= exp_depths
+
+    return np.where(
+        at_or_below.any(axis=-1), at_or_below.argmax(axis=-1), len(exp_depths)
+    )
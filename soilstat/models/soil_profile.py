@@ -1,6 +1,58 @@
-import copy
-from typing import List
-from dataclasses import dataclass
+import bisect
+import math
+from typing import List, Tuple
+from dataclasses import dataclass, replace
+import numpy as np
+from soilstat._jit import njit
+
+
+@njit(cache=True)
+def _calc_stresses(
+    depth: float,
+    bp_depths: np.ndarray,
+    bp_stress: np.ndarray,
+    bp_slope: np.ndarray,
+    ground_water_level: float,
+) -> Tuple[float, float]:
+    """
+    Calculates the normal and effective stress at a depth from the stress breakpoints.
+
+    Parameters:
+        depth (float): The depth (m).
+        bp_depths (np.ndarray): The breakpoint depths, in ascending order.
+        bp_stress (np.ndarray): The normal stress at each breakpoint.
+        bp_slope (np.ndarray): The unit weight that applies below each breakpoint.
+        ground_water_level (float): The groundwater level (m).
+
+    Returns:
+        Tuple[float, float]: The normal and effective stress at the depth.
+    """
+    i = np.searchsorted(bp_depths, depth, side="right") - 1
+    if i < 0:
+        i = 0
+
+    normal_stress = bp_stress[i] + bp_slope[i] * (depth - bp_depths[i])
+
+    # If the depth is above the groundwater table, effective stress equals normal stress
+    if ground_water_level >= depth:
+        return normal_stress, normal_stress
+
+    # 0.981 t/m³ is the unit weight of water
+    pore_pressure = (depth - ground_water_level) * 0.981
+
+    return normal_stress, normal_stress - pore_pressure
+
+
+# Layer fields that SoilProfile copies into its cached arrays
+_CACHED_FIELDS = frozenset(
+    (
+        "thickness",
+        "dry_unit_weight",
+        "saturated_unit_weight",
+        "fine_content",
+        "plasticity_index",
+    )
+)
 
 
 @dataclass
@@ -36,17 +88,82 @@ class SoilLayer:
     is50: float = 0
     kp: float = 0
 
+    # Incremented on every assignment to a cached field of any layer, so profiles
+    # can tell that their arrays are out of date
+    _edit_count = 0
+
+    @classmethod
+    def validated(cls, **kwargs) -> "SoilLayer":
+        """
+        Creates a SoilLayer after checking the fields every calculation depends on.
+
+        Use this for untrusted input, the plain constructor does no checks.
+        """
+        layer = cls(**kwargs)
+        if layer.thickness is None or layer.thickness <= 0:
+            raise ValueError("Thickness of soil layer must be positive.")
+        if layer.dry_unit_weight <= 0 or layer.saturated_unit_weight <= 0:
+            raise ValueError("Unit weights of soil layer must be positive.")
+
+        return layer
+
+
+class _CachedField:
+    """
+    Counts the assignments to a SoilLayer field that SoilProfile caches.
+
+    Only `__set__` is defined, so reading the field still goes straight to the
+    instance dictionary.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def __set__(self, layer: SoilLayer, value) -> None:
+        SoilLayer._edit_count += 1
+        layer.__dict__[self.name] = value
+
+
+for _name in _CACHED_FIELDS:
+    setattr(SoilLayer, _name, _CachedField(_name))
+del _name
+
 
 class SoilProfile:
-    layers: List[SoilLayer]
-    ground_water_level: float
+    _layers: List[SoilLayer]
+    _ground_water_level: float
 
     def __init__(self, layers: List[SoilLayer], ground_water_level: float):
-        self.layers = layers
-        self.ground_water_level = ground_water_level
+        self._layers = layers
+        self._ground_water_level = ground_water_level
         self.validate()
         self.calc_layer_depths()
 
+    @property
+    def layers(self) -> List[SoilLayer]:
+        return self._layers
+
+    @layers.setter
+    def layers(self, layers: List[SoilLayer]) -> None:
+        """
+        Replaces the layers and recalculates their depths and the layer arrays.
+        """
+        self._layers = layers
+        self.validate()
+        self.calc_layer_depths()
+
+    @property
+    def ground_water_level(self) -> float:
+        return self._ground_water_level
+
+    @ground_water_level.setter
+    def ground_water_level(self, ground_water_level: float) -> None:
+        """
+        Moves the groundwater level and recalculates the stress breakpoints.
+        """
+        self._ground_water_level = ground_water_level
+        self.calc_stress_breakpoints()
+
     def validate(self) -> None:
         """
         Validates the SoilProfile object.
@@ -65,105 +182,217 @@ class SoilProfile:
             if layer.thickness is None:
                 raise ValueError("Thickness of soil layer must be specified.")
 
-        if len(self.layers) == 1:
-            self.layers[0].center = self.layers[0].thickness / 2
-            self.layers[0].depth = self.layers[0].thickness
-            return
+        thicknesses = np.fromiter(
+            (layer.thickness for layer in self.layers),
+            dtype=np.float64,
+            count=len(self.layers),
+        )
+        bottoms = np.cumsum(thicknesses)
+        tops = np.concatenate(([0.0], bottoms[:-1]))
+        centers = tops + thicknesses / 2
+
+        for layer, bottom, center in zip(
+            self.layers, bottoms.tolist(), centers.tolist()
+        ):
+            layer.center = center
+            layer.depth = bottom
+
+        self._sync_layers()
+
+    def _sync_layers(self) -> None:
+        """
+        Copies the numeric layer properties used in the stress and layer lookups into arrays,
+        then recalculates the stress breakpoints from them.
+
+        The lookups call `_refresh` first, which runs this again when a layer was edited
+        in place or the layer list changed length since the arrays were built.
+        """
+        count = len(self.layers)
+
+        def column(name: str) -> np.ndarray:
+            values = np.fromiter(
+                (getattr(layer, name) for layer in self.layers),
+                dtype=np.float64,
+                count=count,
+            )
+            # The columns are shared through the read-only properties below
+            values.flags.writeable = False
+            return values
+
+        self._depth_arr = column("depth")
+        self._bottoms = self._depth_arr.tolist()
+        self._thickness = column("thickness")
+        self._dry_unit_weight = column("dry_unit_weight")
+        self._saturated_unit_weight = column("saturated_unit_weight")
+        self._fine_content = column("fine_content")
+        self._plasticity_index = column("plasticity_index")
+
+        self._synced_edit_count = SoilLayer._edit_count
+        self._synced_layer_count = count
 
-        # Initialize the bottom depth and center for the first layer
-        bottom = self.layers[0].thickness
-        center = bottom / 2
+        self.calc_stress_breakpoints()
 
-        # Iterate through the layers to calculate center and bottom depth
-        for i, layer in enumerate(self.layers):
-            if i > 0:
-                thickness = layer.thickness
-                center = bottom + thickness / 2
-                bottom += thickness
+    def _refresh(self) -> None:
+        """
+        Rebuilds the layer arrays and stress breakpoints if they are out of date.
+        """
+        if (
+            self._synced_edit_count != SoilLayer._edit_count
+            or self._synced_layer_count != len(self._layers)
+        ):
+            self.calc_layer_depths()
+
+    @property
+    def layer_bottoms(self) -> np.ndarray:
+        """
+        The bottom depth of every layer, as a read-only array.
+        """
+        self._refresh()
+        return self._depth_arr
+
+    @property
+    def thicknesses(self) -> np.ndarray:
+        """
+        The thickness of every layer, as a read-only array.
+        """
+        self._refresh()
+        return self._thickness
+
+    @property
+    def fine_contents(self) -> np.ndarray:
+        """
+        The fine content of every layer, as a read-only array.
+        """
+        self._refresh()
+        return self._fine_content
+
+    @property
+    def plasticity_indices(self) -> np.ndarray:
+        """
+        The plasticity index of every layer, as a read-only array.
+        """
+        self._refresh()
+        return self._plasticity_index
+
+    def calc_stress_breakpoints(self) -> None:
+        """
+        Calculates the depths where the normal stress gradient changes, the normal stress at
+        each of them and the unit weight that applies below them.
+
+        The breakpoints are the surface, the layer tops and the groundwater level. The last
+        layer is treated as extending indefinitely, so deeper depths are extrapolated with it.
+        """
+        gwt = self.ground_water_level
+
+        tops = np.concatenate(([0.0], self._depth_arr[:-1]))
+        bottoms = self._depth_arr.copy()
+        bottoms[-1] = math.inf
+
+        bp_depths = tops
+        bp_slope = np.where(
+            gwt >= bottoms, self._dry_unit_weight, self._saturated_unit_weight
+        )
+
+        # Split the layer that contains the groundwater table
+        split = np.flatnonzero((tops < gwt) & (gwt < bottoms))
+        if split.size:
+            k = int(split[0])
+            bp_slope[k] = self._dry_unit_weight[k]
+            bp_depths = np.insert(bp_depths, k + 1, gwt)
+            bp_slope = np.insert(bp_slope, k + 1, self._saturated_unit_weight[k])
 
-            self.layers[i].center = center
-            self.layers[i].depth = bottom
+        bp_stress = np.concatenate(
+            ([0.0], np.cumsum(bp_slope[:-1] * np.diff(bp_depths)))
+        )
+
+        self._bp_depths = bp_depths
+        self._bp_stress = bp_stress
+        self._bp_slope = bp_slope
 
     def get_layer_index(self, depth: float) -> int:
         """
         Returns the index of the soil layer at the specified depth.
         """
-        for i, layer in enumerate(self.layers):
-            if layer.depth >= depth:
-                return i
+        self._refresh()
+        i = bisect.bisect_left(self._bottoms, depth)
+
+        return min(i, len(self._layers) - 1)
+
+    def get_layer_indices(self, depths: np.ndarray) -> np.ndarray:
+        """
+        Returns the index of the soil layer at each of the specified depths.
+        """
+        self._refresh()
+        i = np.searchsorted(self._depth_arr, depths, side="left")
 
-        return len(self.layers) - 1
+        return np.minimum(i, len(self._layers) - 1)
 
     def get_layer_at_depth(self, depth: float) -> SoilLayer:
         """
         Returns the soil layer at the specified depth.
         """
-        return self.layers[self.get_layer_index(depth)]
+        return self._layers[self.get_layer_index(depth)]
 
     def calc_normal_stress(self, depth: float) -> float:
         """
         Calculates the normal stress at the specified depth.
         """
-        # Get the index of the layer at the given depth
-
-        layer_index = self.get_layer_index(depth)
-
-        # Initialize total stress
-        total_stress = 0.0
-
-        # Iterate through layers up to the layer containing the specified depth
-        previous_depth = 0.0
-        for i, layer in enumerate(self.layers[: layer_index + 1]):
-            if i == layer_index:
-                # Adjust the depth for the last layer (partial thickness)
-                layer_thickness = depth - previous_depth
-            else:
-                # Full thickness for earlier layers
-                layer_thickness = layer.thickness
-
-            # Calculate the contribution to stress
-            if self.ground_water_level >= previous_depth + layer_thickness:
-                # Entirely above groundwater table (dry unit weight applies)
-                total_stress += layer.dry_unit_weight * layer_thickness
-            elif self.ground_water_level <= previous_depth:
-                # Entirely below groundwater table (saturated unit weight applies)
-                total_stress += layer.saturated_unit_weight * layer_thickness
-            else:
-                # Partially submerged (both dry and saturated weights apply)
-                dry_thickness = self.ground_water_level - previous_depth
-                submerged_thickness = layer_thickness - dry_thickness
-                total_stress += (
-                    layer.dry_unit_weight * dry_thickness
-                    + layer.saturated_unit_weight * submerged_thickness
-                )
-
-            # Update the previous depth
-            previous_depth += layer_thickness
-
-        return total_stress
+        return self.calc_stresses(depth)[0]
+
+    def calc_normal_stress_vec(self, depths: np.ndarray) -> np.ndarray:
+        """
+        Calculates the normal stress at each of the specified depths.
+        """
+        self._refresh()
+        depths = np.asarray(depths, dtype=np.float64)
+        i = np.maximum(np.searchsorted(self._bp_depths, depths, side="right") - 1, 0)
+
+        return self._bp_stress[i] + self._bp_slope[i] * (depths - self._bp_depths[i])
+
+    def calc_effective_stress_vec(self, depths: np.ndarray) -> np.ndarray:
+        """
+        Calculates the effective stress at each of the specified depths.
+        """
+        depths = np.asarray(depths, dtype=np.float64)
+        # 0.981 t/m³ is the unit weight of water
+        pore_pressure = np.maximum(depths - self.ground_water_level, 0) * 0.981
+
+        return self.calc_normal_stress_vec(depths) - pore_pressure
 
     def calc_effective_stress(self, depth: float) -> float:
         """
         Calculates the effective stress at the specified depth.
         """
-        # Calculate the total normal stress at the given depth
-        normal_stress = self.calc_normal_stress(depth)
+        return self.calc_stresses(depth)[1]
+
+    def layer_and_stresses(self, depth: float) -> Tuple[SoilLayer, float, float]:
+        """
+        Returns the soil layer, normal stress and effective stress at the specified depth.
+        """
+        normal_stress, effective_stress = self.calc_stresses(depth)
+
+        return self.get_layer_at_depth(depth), normal_stress, effective_stress
+
+    def calc_stresses(self, depth: float) -> Tuple[float, float]:
+        """
+        Calculates the normal and effective stress at the specified depth in one lookup.
+        """
+        self._refresh()
+        normal_stress, effective_stress = _calc_stresses(
+            float(depth),
+            self._bp_depths,
+            self._bp_stress,
+            self._bp_slope,
+            float(self._ground_water_level),
+        )
 
-        # If the depth is above the groundwater table, effective stress equals normal stress
-        if self.ground_water_level >= depth:
-            return normal_stress
-        else:
-            # Subtract pore water pressure for depths below the groundwater table
-            pore_pressure = (
-                depth - self.ground_water_level
-            ) * 0.981  # 0.981 t/m³ is the unit weight of water
-            return normal_stress - pore_pressure
+        return float(normal_stress), float(effective_stress)
 
     def copy(self) -> "SoilProfile":
         """
         Creates a deep copy of the SoilProfile instance.
         """
         return SoilProfile(
-            layers=[copy.deepcopy(layer) for layer in self.layers],
+            layers=[replace(layer) for layer in self.layers],
             ground_water_level=self.ground_water_level,
         )
@@ -1,32 +1,51 @@
 from pydantic import ValidationError
+import numpy as np
 import pytest
 from math import isclose
 from soilstat.bearing_capacity.vesic import (
     calc_bearing_capacity_factors,
+    calc_bearing_capacity_factors_vec,
     calc_shape_factors,
+    calc_shape_factors_vec,
     calc_load_inclination_factors,
     calc_base_factors,
     calc_ground_factors,
     calc_depth_factors,
+    calc_all_vesic_factors,
 )
 
+
+def assert_close3(actual, expected, rtol=1e-3):
+    """
+    Compares the three factors returned by a Vesic function in one assertion.
+    """
+    np.testing.assert_allclose(np.asarray(actual), np.asarray(expected), rtol=rtol)
+
+
 """Test calc_bearing_capacity_factors"""
 
 
-@pytest.mark.parametrize(
-    "phi, expected",
-    [
-        (0, (5.14, 1.0, 0.0)),
-        (10, (8.345, 2.471, 0.519)),
-        (30, (30.140, 18.401, 20.093)),
-        (45, (133.874, 134.874, 267.748)),
-    ],
-)
-def test_calc_bearing_capacity_factors(phi, expected):
-    nc, nq, ng = calc_bearing_capacity_factors(phi)
-    assert isclose(nc, expected[0], rel_tol=1e-3)
-    assert isclose(nq, expected[1], rel_tol=1e-3)
-    assert isclose(ng, expected[2], rel_tol=1e-3)
+@pytest.fixture(scope="module")
+def bc_cases():
+    """
+    Friction angles and their expected (Nc, Nq, Ng) factors.
+    """
+    phi = np.array([0, 10, 30, 45])
+    expected = np.array(
+        [
+            [5.14, 1.0, 0.0],
+            [8.345, 2.471, 0.519],
+            [30.140, 18.401, 20.093],
+            [133.874, 134.874, 267.748],
+        ]
+    )
+
+    return phi, expected
+
+
+def test_calc_bearing_capacity_factors(bc_cases):
+    for phi, expected in zip(*bc_cases):
+        assert_close3(calc_bearing_capacity_factors(phi), expected)
 
 
 def test_calc_bearing_capacity_factors_invalid_input():
@@ -34,23 +53,53 @@ def test_calc_bearing_capacity_factors_invalid_input():
         calc_bearing_capacity_factors(-10)
 
 
+def test_calc_bearing_capacity_factors_vec(bc_cases):
+    phi, expected = bc_cases
+    result = calc_bearing_capacity_factors_vec(phi)
+
+    assert result.shape == (3, 4)
+    np.testing.assert_allclose(result.T, expected, rtol=1e-3)
+    np.testing.assert_allclose(
+        result.T, [calc_bearing_capacity_factors(p) for p in phi], rtol=1e-12
+    )
+
+
+def test_calc_bearing_capacity_factors_vec_invalid_input():
+    with pytest.raises(ValueError):
+        calc_bearing_capacity_factors_vec(np.array([10, -10]))
+
+
 """Test calc_shape_factors"""
 
 
-@pytest.mark.parametrize(
-    "foundation_width, foundation_length, nq, nc, phi, expected",
-    [
-        (2, 4, 18.4, 30.1, 30, (1.306, 1.289, 0.8)),
-        (3, 6, 10.0, 20.0, 20, (1.25, 1.182, 0.8)),
-        (5, 5, 25.0, 40.0, 45, (1.625, 2, 0.6)),
-        (4, 10, 15.0, 25.0, 35, (1.24, 1.28, 0.84)),
-    ],
-)
-def test_calc_shape_factors(foundation_width, foundation_length, nq, nc, phi, expected):
-    result = calc_shape_factors(foundation_width, foundation_length, nq, nc, phi)
-    assert isclose(result[0], expected[0], rel_tol=1e-3)  # Sc
-    assert isclose(result[1], expected[1], rel_tol=1e-3)  # Sq
-    assert isclose(result[2], expected[2], rel_tol=1e-3)  # Sg
+@pytest.fixture(scope="module")
+def shape_cases():
+    """
+    (width, length, Nq, Nc, phi) rows and their expected (Sc, Sq, Sg) factors.
+    """
+    cases = np.array(
+        [
+            (2, 4, 18.4, 30.1, 30),
+            (3, 6, 10.0, 20.0, 20),
+            (5, 5, 25.0, 40.0, 45),
+            (4, 10, 15.0, 25.0, 35),
+        ]
+    )
+    expected = np.array(
+        [
+            (1.306, 1.289, 0.8),
+            (1.25, 1.182, 0.8),
+            (1.625, 2, 0.6),
+            (1.24, 1.28, 0.84),
+        ]
+    )
+
+    return cases, expected
+
+
+def test_calc_shape_factors(shape_cases):
+    for case, expected in zip(*shape_cases):
+        assert_close3(calc_shape_factors(*case), expected)
 
 
 @pytest.mark.parametrize(
@@ -70,6 +119,25 @@ def test_calc_shape_factors_invalid_input(
         calc_shape_factors(foundation_width, foundation_length, nq, nc, phi)
 
 
+def test_calc_shape_factors_vec(shape_cases):
+    cases, expected = shape_cases
+    result = calc_shape_factors_vec(*cases.T)
+
+    assert result.shape == (3, 4)
+    np.testing.assert_allclose(result.T, expected, rtol=1e-3)
+    np.testing.assert_allclose(
+        result.T, [calc_shape_factors(*case) for case in cases], rtol=1e-12
+    )
+
+
+def test_calc_shape_factors_vec_invalid_input():
+    with pytest.raises(ValueError):
+        calc_shape_factors_vec(np.array([2, -2]), 4, 18.4, 30.1, 30)
+
+    with pytest.raises(ValueError):
+        calc_shape_factors_vec(2, 4, 18.4, 30.1, np.array([30, 95]))
+
+
 """Test calc_shape_factors"""
 
 
@@ -103,9 +171,7 @@ def test_calc_load_inclination_factors(
         horizontal_load_x,
         horizontal_load_y,
     )
-    assert isclose(result[0], expected[0], rel_tol=1e-3)  # ic
-    assert isclose(result[1], expected[1], rel_tol=1e-3)  # iq
-    assert isclose(result[2], expected[2], rel_tol=1e-3)  # ig
+    assert_close3(result, expected)
 
 
 @pytest.mark.parametrize(
@@ -158,9 +224,7 @@ def test_calc_load_inclination_factors_invalid_input(
 )
 def test_calc_base_factors(phi, slope_angle, base_angle, expected):
     result = calc_base_factors(phi, slope_angle, base_angle)
-    assert isclose(result[0], expected[0], rel_tol=1e-3)  # bc
-    assert isclose(result[1], expected[1], rel_tol=1e-3)  # bq
-    assert isclose(result[2], expected[2], rel_tol=1e-3)  # bg
+    assert_close3(result, expected)
 
 
 @pytest.mark.parametrize(
@@ -190,9 +254,7 @@ def test_calc_base_factors_invalid(phi, slope_angle, base_angle):
 )
 def test_calc_ground_factors(iq, slope_angle, phi, expected):
     result = calc_ground_factors(iq, slope_angle, phi)
-    assert isclose(result[0], expected[0], rel_tol=1e-3)  # gc
-    assert isclose(result[1], expected[1], rel_tol=1e-3)  # gq
-    assert isclose(result[2], expected[2], rel_tol=1e-3)  # gg
+    assert_close3(result, expected)
 
 
 @pytest.mark.parametrize(
@@ -222,9 +284,7 @@ def test_calc_ground_factors_invalid_input(iq, slope_angle, phi):
 )
 def test_calc_depth_factors(foundation_depth, foundation_width, phi, expected):
     result = calc_depth_factors(foundation_depth, foundation_width, phi)
-    assert isclose(result[0], expected[0], rel_tol=1e-3)  # dc
-    assert isclose(result[1], expected[1], rel_tol=1e-3)  # dq
-    assert isclose(result[2], expected[2], rel_tol=1e-3)  # dg
+    assert_close3(result, expected)
 
 
 @pytest.mark.parametrize(
@@ -238,3 +298,70 @@ def test_calc_depth_factors(foundation_depth, foundation_width, phi, expected):
 def test_calc_depth_factors_invalid_input(foundation_depth, foundation_width, phi):
     with pytest.raises(ValidationError):
         calc_depth_factors(foundation_depth, foundation_width, phi)
+
+
+"""Test calc_all_vesic_factors"""
+
+
+@pytest.mark.parametrize(
+    "phi, cohesion, foundation_width, foundation_length, foundation_depth, foundation_base_angle, slope_angle, vertical_load, horizontal_load_x, horizontal_load_y",
+    [
+        (0, 25, 4, 6, 1, 10, 10, 200, 15, 20),
+        (30, 30, 5, 10, 3, 15, 10, 300, 20, 25),
+        (45, 20, 3, 8, 2, 20, 20, 250, 30, 35),
+    ],
+)
+def test_calc_all_vesic_factors(
+    phi,
+    cohesion,
+    foundation_width,
+    foundation_length,
+    foundation_depth,
+    foundation_base_angle,
+    slope_angle,
+    vertical_load,
+    horizontal_load_x,
+    horizontal_load_y,
+):
+    result = calc_all_vesic_factors(
+        phi,
+        cohesion,
+        foundation_width,
+        foundation_length,
+        foundation_depth,
+        foundation_base_angle,
+        slope_angle,
+        vertical_load,
+        horizontal_load_x,
+        horizontal_load_y,
+    )
+
+    nc, nq, ng = calc_bearing_capacity_factors(phi)
+    inclination = calc_load_inclination_factors(
+        phi,
+        cohesion,
+        foundation_width,
+        foundation_length,
+        foundation_base_angle,
+        vertical_load,
+        horizontal_load_x,
+        horizontal_load_y,
+    )
+    expected = {
+        "bearing_capacity": (nc, nq, ng),
+        "shape": calc_shape_factors(foundation_width, foundation_length, nq, nc, phi),
+        "load_inclination": inclination,
+        "base": calc_base_factors(phi, slope_angle, foundation_base_angle),
+        "ground": calc_ground_factors(inclination[1], slope_angle, phi),
+        "depth": calc_depth_factors(foundation_depth, foundation_width, phi),
+    }
+
+    assert result.keys() == expected.keys()
+    for key, factors in expected.items():
+        for value, expected_value in zip(result[key], factors):
+            assert isclose(value, expected_value, rel_tol=1e-9)
+
+
+def test_calc_all_vesic_factors_invalid_input():
+    with pytest.raises(ValidationError):
+        calc_all_vesic_factors(-1, 25, 4, 6, 1, 10, 10, 200, 15, 20)
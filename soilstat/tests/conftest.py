@@ -0,0 +1,64 @@
+import pytest
+from soilstat.models.soil_profile import SoilLayer, SoilProfile
+from soilstat.tests.test_data.soil_profile import soil_profile
+
+
+@pytest.fixture(scope="session")
+def shared_soil_profile():
+    """
+    The three layer profile from the test data, with GWT at 1 meter.
+    """
+    return soil_profile
+
+
+@pytest.fixture(scope="session")
+def three_layer_profile():
+    """
+    A three layer profile with GWT at 3.0 meters, inside the second layer.
+    """
+    # Define multiple soil layers
+    layer1 = SoilLayer(dry_unit_weight=1.8, saturated_unit_weight=2.0, thickness=2.0)
+    layer2 = SoilLayer(dry_unit_weight=1.9, saturated_unit_weight=2.1, thickness=3.0)
+    layer3 = SoilLayer(dry_unit_weight=2.0, saturated_unit_weight=2.2, thickness=1.5)
+
+    return SoilProfile(layers=[layer1, layer2, layer3], ground_water_level=3.0)
+
+
+@pytest.fixture(scope="session")
+def liquefaction_profile():
+    """
+    A four layer profile with GWT at 3.0 meters, inside the second layer.
+
+    The layer bottoms (2, 5, 9 and 15 meters) are always analysed, so every
+    liquefaction run includes depths exactly on a layer boundary.
+    """
+    layers = [
+        SoilLayer(
+            thickness=2.0,
+            dry_unit_weight=1.8,
+            saturated_unit_weight=2.0,
+            fine_content=5,
+        ),
+        SoilLayer(
+            thickness=3.0,
+            dry_unit_weight=1.9,
+            saturated_unit_weight=2.1,
+            fine_content=12,
+            plasticity_index=5,
+        ),
+        SoilLayer(
+            thickness=4.0,
+            dry_unit_weight=1.9,
+            saturated_unit_weight=2.0,
+            fine_content=20,
+            plasticity_index=15,
+        ),
+        SoilLayer(
+            thickness=6.0,
+            dry_unit_weight=2.0,
+            saturated_unit_weight=2.2,
+            fine_content=35,
+        ),
+    ]
+
+    return SoilProfile(layers=layers, ground_water_level=3.0)
@@ -0,0 +1,155 @@
+from dataclasses import replace
+
+import pytest
+import soilstat.liquefaction.helper_functions as hf
+import soilstat.liquefaction.settlement as settlement
+import soilstat.models.soil_profile as soil_profile_module
+from soilstat.liquefaction.cpt import boulanger_idriss
+from soilstat.liquefaction.masw import andrus_stokoe
+from soilstat.liquefaction.spt import idriss
+from soilstat.models.CPT import CPTExp, CPTLog
+from soilstat.models.MASW import MASWExp, MASWLog
+from soilstat.models.SPT import SPTExp, SPTLog
+
+"""Test analyse_liquefaction against analyse_for_layer for every method"""
+
+CPT_EXPS = [
+    CPTExp(depth=1.0, cone_resistance=40.0),
+    CPTExp(depth=2.5, cone_resistance=65.0),
+    CPTExp(depth=4.0, cone_resistance=90.0),
+    CPTExp(depth=5.0, cone_resistance=55.0),
+    CPTExp(depth=7.0, cone_resistance=120.0),
+    CPTExp(depth=11.0, cone_resistance=160.0),
+]
+
+MASW_EXPS = [
+    MASWExp(depth=1.0, shear_wave_velocity=140.0),
+    MASWExp(depth=2.5, shear_wave_velocity=160.0),
+    MASWExp(depth=4.0, shear_wave_velocity=170.0),
+    MASWExp(depth=5.0, shear_wave_velocity=150.0),
+    MASWExp(depth=7.0, shear_wave_velocity=238.0),
+    MASWExp(depth=11.0, shear_wave_velocity=260.0),
+]
+
+SPT_EXPS = [
+    SPTExp(depth=1.5, n=8, n90=6, n160=12, n160f=14),
+    SPTExp(depth=4.5, n=12, n90=10, n160=16, n160f=19),
+    SPTExp(depth=7.5, n=18, n90=15, n160=22, n160f=25),
+    SPTExp(depth=12.0, n=26, n90=24, n160=31, n160f=33),
+]
+
+METHODS = [
+    pytest.param(boulanger_idriss, CPTLog, CPT_EXPS, id="cpt"),
+    pytest.param(andrus_stokoe, MASWLog, MASW_EXPS, id="masw"),
+    pytest.param(idriss, SPTLog, SPT_EXPS, id="spt"),
+]
+
+
+@pytest.fixture(params=["jit", "python"])
+def jit_mode(request, monkeypatch):
+    """
+    Runs the test with the compiled kernels, and again with their pure Python versions.
+    """
+    if request.param == "python":
+        modules = [
+            boulanger_idriss,
+            andrus_stokoe,
+            idriss,
+            hf,
+            settlement,
+            soil_profile_module,
+        ]
+        for module in modules:
+            for name, value in list(vars(module).items()):
+                if hasattr(value, "py_func"):
+                    monkeypatch.setattr(module, name, value.py_func)
+
+    return request.param
+
+
+def analyse_each_depth(method, soil_profile, exp_log, Mw, pga):
+    """
+    Runs analyse_for_layer of the method at every depth analyse_liquefaction covers.
+    """
+    MSF = hf.calc_msf(Mw)
+    # The CPT method also takes the magnitude
+    extra = (Mw,) if method is boulanger_idriss else ()
+
+    return [
+        method.analyse_for_layer(
+            soil_profile, exp_log.get_exp_at_depth(depth), depth, MSF, pga, *extra
+        )
+        for depth in hf.get_all_depths(soil_profile, exp_log)
+    ]
+
+
+def assert_matches_layers(method, soil_profile, exp_log, Mw, pga):
+    results = hf.as_dicts(method.analyse_liquefaction(soil_profile, exp_log, Mw, pga))
+    expected = analyse_each_depth(method, soil_profile, exp_log, Mw, pga)
+
+    assert len(results) == len(expected)
+    for result, row in zip(results, expected):
+        assert result == pytest.approx(row, rel=1e-9)
+
+
+@pytest.mark.parametrize("method, log_class, exps", METHODS)
+@pytest.mark.parametrize("Mw, pga", [(7.5, 0.4), (6.0, 0.25)])
+def test_analyse_liquefaction(liquefaction_profile, method, log_class, exps, Mw, pga):
+    exp_log = log_class(exps)
+
+    # Several depths resolve to the same experiment and share its result
+    depths = hf.get_all_depths(liquefaction_profile, exp_log)
+    assert len({id(exp_log.get_exp_at_depth(depth)) for depth in depths}) < len(depths)
+
+    assert_matches_layers(method, liquefaction_profile, exp_log, Mw, pga)
+
+
+@pytest.mark.parametrize("method, log_class, exps", METHODS)
+def test_analyse_liquefaction_unsorted(liquefaction_profile, method, log_class, exps):
+    # Experiments given out of depth order are looked up in list order
+    exp_log = log_class(exps[1::2] + exps[::2])
+
+    assert_matches_layers(method, liquefaction_profile, exp_log, 7.5, 0.4)
+
+
+@pytest.mark.parametrize("method, log_class, exps", METHODS)
+def test_analyse_liquefaction_surface_experiment(
+    liquefaction_profile, method, log_class, exps
+):
+    # The experiment at the surface has no normal stress, so its CSR is zero
+    exp_log = log_class([replace(exps[0], depth=0.0), *exps[1:]])
+
+    with pytest.raises(ZeroDivisionError):
+        analyse_each_depth(method, liquefaction_profile, exp_log, 7.5, 0.4)
+
+    with pytest.raises(ZeroDivisionError):
+        method.analyse_liquefaction(liquefaction_profile, exp_log, 7.5, 0.4)
+
+
+@pytest.mark.parametrize("method, log_class, exps", METHODS)
+def test_analyse_liquefaction_zero_pga(liquefaction_profile, method, log_class, exps):
+    # Without ground acceleration the CSR is zero everywhere
+    exp_log = log_class(exps)
+
+    with pytest.raises(ZeroDivisionError):
+        analyse_each_depth(method, liquefaction_profile, exp_log, 7.5, 0.0)
+
+    with pytest.raises(ZeroDivisionError):
+        method.analyse_liquefaction(liquefaction_profile, exp_log, 7.5, 0.0)
+
+
+@pytest.mark.parametrize("method, log_class, exps", METHODS)
+def test_analyse_liquefaction_water_above_ground(
+    liquefaction_profile, jit_mode, method, log_class, exps
+):
+    # With the groundwater level above the ground the effective stress near the
+    # surface is negative, which must fail the same way with and without the JIT
+    soil_profile = liquefaction_profile.copy()
+    soil_profile.ground_water_level = -2.0
+    exp_log = log_class([replace(exps[0], depth=0.5), *exps[1:]])
+
+    with pytest.raises(ValueError):
+        analyse_each_depth(method, soil_profile, exp_log, 7.5, 0.4)
+
+    with pytest.raises(ValueError):
+        method.analyse_liquefaction(soil_profile, exp_log, 7.5, 0.4)
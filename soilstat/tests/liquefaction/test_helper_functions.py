@@ -0,0 +1,52 @@
+import numpy as np
+import pytest
+from soilstat.liquefaction.helper_functions import (
+    calc_rd,
+    calc_rd_array,
+    check_safety,
+    check_safety_array,
+)
+from soilstat.models.soil_profile import SoilLayer
+
+"""Test calc_rd"""
+
+
+@pytest.mark.parametrize(
+    "depth, expected",
+    [
+        (0, 1.0),
+        (5, 0.96175),
+        (9.15, 0.930),
+        (15, 0.7735),
+        (25, 0.544),
+        (35, 0.5),
+    ],
+)
+def test_calc_rd(depth, expected):
+    assert calc_rd(depth) == pytest.approx(expected, rel=1e-3)
+
+
+def test_calc_rd_array():
+    depths = np.array([0, 1.5, 5, 9.15, 9.2, 15, 22.99, 23, 25, 29.99, 30, 35])
+
+    result = calc_rd_array(depths)
+
+    assert result.shape == depths.shape
+    np.testing.assert_array_equal(result, [calc_rd(depth) for depth in depths])
+
+
+def test_check_safety_array(shared_soil_profile):
+    depths = np.array([0.5, 2.0, 2.0, 5.0, 10.0, 10.0])
+    safety_factor = np.array([0.5, 1.2, 0.8, 0.8, 1.0, 1.1])
+    plasticity_index = np.array([0, 0, 0, 20, 12, 0])
+
+    result = check_safety_array(
+        shared_soil_profile, depths, safety_factor, 1.1, plasticity_index
+    )
+
+    np.testing.assert_array_equal(result, [True, True, False, True, False, True])
+    for depth, sf, pi, is_safe in zip(depths, safety_factor, plasticity_index, result):
+        layer = SoilLayer(
+            thickness=1, dry_unit_weight=1, saturated_unit_weight=1, plasticity_index=pi
+        )
+        assert check_safety(shared_soil_profile, depth, sf, 1.1, layer) == is_safe
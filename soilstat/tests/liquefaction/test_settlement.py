@@ -0,0 +1,47 @@
+import numpy as np
+import pytest
+from soilstat.liquefaction.settlement import settlement_obj
+
+# Safety factors covering the s1, s2 and no settlement branches
+safety_factors = np.array([0.3, 0.8, 1.0, 1.5, 1.9, 2.0, 2.5])
+thicknesses = np.linspace(0.5, 3.5, len(safety_factors))
+
+
+@pytest.mark.parametrize("qci", [33.0, 60.0, 110.0, 200.0])
+def test_calc_settlement_via_qci_array(qci):
+    qcis = np.full(len(safety_factors), qci)
+    result = settlement_obj.calc_settlement_via_qci_array(
+        safety_factors, thicknesses, qcis
+    )
+
+    expected = [
+        settlement_obj.calc_settlement_via_qci(sf, t, qci)
+        for sf, t in zip(safety_factors, thicknesses)
+    ]
+    np.testing.assert_allclose(result, expected, rtol=1e-12)
+
+
+def test_calc_settlement_via_n90_array():
+    n90 = np.array([1, 3, 7.6, 12, 25, 30, 41])
+    result = settlement_obj.calc_settlement_via_n90_array(
+        safety_factors, thicknesses, n90
+    )
+
+    expected = [
+        settlement_obj.calc_settlement_via_n90(sf, t, n)
+        for sf, t, n in zip(safety_factors, thicknesses, n90)
+    ]
+    np.testing.assert_allclose(result, expected, rtol=1e-12)
+
+
+def test_calc_settlement_via_vs1c_array():
+    vs1c = np.array([100.0, 150.0, 180.0, 200.0, 210.0, 215.0, 250.0])
+    result = settlement_obj.calc_settlement_via_vs1c_array(
+        safety_factors, thicknesses, vs1c
+    )
+
+    expected = [
+        settlement_obj.calc_settlement_via_vs1c(sf, t, v)
+        for sf, t, v in zip(safety_factors, thicknesses, vs1c)
+    ]
+    np.testing.assert_allclose(result, expected, rtol=1e-12)
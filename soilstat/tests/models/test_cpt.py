@@ -0,0 +1,33 @@
+from soilstat.models.CPT import CPTExp, CPTLog
+
+
+def test_get_exp_at_depth():
+    """
+    Test that get_exp_at_depth returns the experiment before the first one at or below the depth.
+    """
+    log = CPTLog(
+        [
+            CPTExp(depth=1.5, cone_resistance=100),
+            CPTExp(depth=4.5, cone_resistance=150),
+            CPTExp(depth=7.5, cone_resistance=200),
+        ]
+    )
+
+    for depth, i in [(0.5, 2), (1.5, 2), (2.0, 0), (4.5, 0), (6.0, 1), (20.0, 2)]:
+        assert log.get_exp_at_depth(depth) is log.exps[i]
+
+
+def test_get_exp_at_depth_unsorted():
+    """
+    Test that experiments given out of depth order are looked up in list order.
+    """
+    log = CPTLog(
+        [
+            CPTExp(depth=4.5, cone_resistance=150),
+            CPTExp(depth=1.5, cone_resistance=100),
+            CPTExp(depth=7.5, cone_resistance=200),
+        ]
+    )
+
+    for depth, i in [(0.5, 2), (2.0, 2), (4.5, 2), (6.0, 1), (7.5, 1), (20.0, 2)]:
+        assert log.get_exp_at_depth(depth) is log.exps[i]
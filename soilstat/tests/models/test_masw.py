@@ -0,0 +1,33 @@
+from soilstat.models.MASW import MASWExp, MASWLog
+
+
+def test_get_exp_at_depth():
+    """
+    Test that get_exp_at_depth returns the experiment before the first one at or below the depth.
+    """
+    log = MASWLog(
+        [
+            MASWExp(depth=1.5, shear_wave_velocity=100),
+            MASWExp(depth=4.5, shear_wave_velocity=150),
+            MASWExp(depth=7.5, shear_wave_velocity=200),
+        ]
+    )
+
+    for depth, i in [(0.5, 2), (1.5, 2), (2.0, 0), (4.5, 0), (6.0, 1), (20.0, 2)]:
+        assert log.get_exp_at_depth(depth) is log.exps[i]
+
+
+def test_get_exp_at_depth_unsorted():
+    """
+    Test that experiments given out of depth order are looked up in list order.
+    """
+    log = MASWLog(
+        [
+            MASWExp(depth=4.5, shear_wave_velocity=150),
+            MASWExp(depth=1.5, shear_wave_velocity=100),
+            MASWExp(depth=7.5, shear_wave_velocity=200),
+        ]
+    )
+
+    for depth, i in [(0.5, 2), (2.0, 2), (4.5, 2), (6.0, 1), (7.5, 1), (20.0, 2)]:
+        assert log.get_exp_at_depth(depth) is log.exps[i]
@@ -1,44 +1,57 @@
+from dataclasses import replace
+import numpy as np
 import pytest
-from soilstat.tests.test_data.soil_profile import soil_profile
 from soilstat.models.soil_profile import SoilLayer, SoilProfile
 
 
-def test_calc_layer_depths():
+def test_calc_layer_depths(shared_soil_profile):
     """
     Test the calc_layer_depths() method to ensure it correctly calculates layer depths and centers.
     """
     # Create sample layers
     # Assert calculated values for each layer
-    assert soil_profile.layers[0].center == 1.0
-    assert soil_profile.layers[0].depth == 2.0
+    assert shared_soil_profile.layers[0].center == 1.0
+    assert shared_soil_profile.layers[0].depth == 2.0
 
-    assert soil_profile.layers[1].center == 4.5
-    assert soil_profile.layers[1].depth == 7.0
+    assert shared_soil_profile.layers[1].center == 4.5
+    assert shared_soil_profile.layers[1].depth == 7.0
 
-    assert soil_profile.layers[2].center == 14.5
-    assert soil_profile.layers[2].depth == 22
+    assert shared_soil_profile.layers[2].center == 14.5
+    assert shared_soil_profile.layers[2].depth == 22
 
 
-def test_get_layer_index():
+def test_get_layer_index(shared_soil_profile):
     """
     Test the get_layer_index() method to ensure it returns the correct layer index for a given depth.
     """
     # Test depths within each layer
-    assert soil_profile.get_layer_index(1.0) == 0  # Depth in first layer
-    assert soil_profile.get_layer_index(2.5) == 1  # Depth in second layer
-    assert soil_profile.get_layer_index(8.0) == 2  # Depth in third layer
+    assert shared_soil_profile.get_layer_index(1.0) == 0  # Depth in first layer
+    assert shared_soil_profile.get_layer_index(2.5) == 1  # Depth in second layer
+    assert shared_soil_profile.get_layer_index(8.0) == 2  # Depth in third layer
 
     # Test depth exactly at layer boundaries
-    assert soil_profile.get_layer_index(2.0) == 0  # Exact bottom of first layer
-    assert soil_profile.get_layer_index(7.0) == 1  # Exact bottom of second layer
-    assert soil_profile.get_layer_index(22) == 2  # Exact bottom of third layer
+    assert shared_soil_profile.get_layer_index(2.0) == 0  # Exact bottom of first layer
+    assert shared_soil_profile.get_layer_index(7.0) == 1  # Exact bottom of second layer
+    assert shared_soil_profile.get_layer_index(22) == 2  # Exact bottom of third layer
 
     # Test depth beyond all layers
     assert (
-        soil_profile.get_layer_index(30.0) == 2
+        shared_soil_profile.get_layer_index(30.0) == 2
     )  # Beyond all layers, should return last layer
 
 
+def test_get_layer_indices(shared_soil_profile):
+    """
+    Test that get_layer_indices() matches get_layer_index() for an array of depths.
+    """
+    depths = np.array([1.0, 2.5, 8.0, 2.0, 7.0, 22, 30.0])
+
+    indices = shared_soil_profile.get_layer_indices(depths)
+
+    np.testing.assert_array_equal(indices, [0, 1, 2, 0, 1, 2, 2])
+    assert indices.tolist() == [shared_soil_profile.get_layer_index(d) for d in depths]
+
+
 def test_calc_normal_stress_single_layer():
     """
     Test normal stress calculation for a soil profile with a single layer.
@@ -63,29 +76,21 @@ def test_calc_normal_stress_single_layer():
     )  # Below GWT
 
 
-def test_calc_normal_stress_multiple_layers():
+def test_calc_normal_stress_multiple_layers(three_layer_profile):
     """
     Test normal stress calculation for a soil profile with multiple layers.
     """
-    # Define multiple soil layers
-    layer1 = SoilLayer(dry_unit_weight=1.8, saturated_unit_weight=2.0, thickness=2.0)
-    layer2 = SoilLayer(dry_unit_weight=1.9, saturated_unit_weight=2.1, thickness=3.0)
-    layer3 = SoilLayer(dry_unit_weight=2.0, saturated_unit_weight=2.2, thickness=1.5)
-
-    # Create a soil profile with GWT at 3.0 meters
-    soil_profile = SoilProfile(layers=[layer1, layer2, layer3], ground_water_level=3.0)
-
     # Test stress at different depths
-    assert soil_profile.calc_normal_stress(1.0) == pytest.approx(
+    assert three_layer_profile.calc_normal_stress(1.0) == pytest.approx(
         1.8, rel=1e-3
     )  # In layer 1, above GWT
-    assert soil_profile.calc_normal_stress(3.0) == pytest.approx(
+    assert three_layer_profile.calc_normal_stress(3.0) == pytest.approx(
         5.5, rel=1e-3
     )  # At GWT, end of layer 1
-    assert soil_profile.calc_normal_stress(4.0) == pytest.approx(
+    assert three_layer_profile.calc_normal_stress(4.0) == pytest.approx(
         7.6, rel=1e-3
     )  # In layer 2, below GWT
-    assert soil_profile.calc_normal_stress(6.0) == pytest.approx(
+    assert three_layer_profile.calc_normal_stress(6.0) == pytest.approx(
         11.9, rel=1e-3
     )  # In layer 3, below GWT
 
@@ -205,3 +210,183 @@ def test_calc_effective_stress_full_saturation():
     assert soil_profile.calc_effective_stress(5.0) == pytest.approx(
         5.395, rel=1e-3
     )  # Fully saturated
+
+
+def test_calc_normal_stress_vec(three_layer_profile):
+    """
+    Test that the vectorized normal stress matches the scalar calculation, including below the GWT
+    and below the last layer.
+    """
+    depths = np.array([0.0, 1.0, 2.0, 2.5, 3.0, 4.0, 5.0, 6.0, 6.5, 8.0])
+    stresses = three_layer_profile.calc_normal_stress_vec(depths)
+
+    assert stresses.shape == depths.shape
+    for depth, stress in zip(depths, stresses):
+        assert stress == pytest.approx(
+            three_layer_profile.calc_normal_stress(depth), rel=1e-9
+        )
+
+    assert three_layer_profile.calc_normal_stress(8.0) == pytest.approx(16.3, rel=1e-3)
+
+
+def test_calc_stresses(three_layer_profile):
+    """
+    Test that calc_stresses returns the same normal and effective stress as the separate methods.
+    """
+    for depth in [1.0, 3.0, 4.0, 6.0]:
+        normal_stress, effective_stress = three_layer_profile.calc_stresses(depth)
+
+        assert normal_stress == three_layer_profile.calc_normal_stress(depth)
+        assert effective_stress == three_layer_profile.calc_effective_stress(depth)
+
+    assert three_layer_profile.calc_stresses(4.0) == pytest.approx(
+        (7.6, 6.619), rel=1e-3
+    )
+
+
+def test_copy(shared_soil_profile):
+    """
+    Test that copy() returns an equal profile whose layers are independent of the original.
+    """
+    profile_copy = shared_soil_profile.copy()
+
+    assert profile_copy.ground_water_level == shared_soil_profile.ground_water_level
+    assert profile_copy.layers == shared_soil_profile.layers
+    assert all(
+        copied is not original
+        for copied, original in zip(profile_copy.layers, shared_soil_profile.layers)
+    )
+
+    profile_copy.layers[0].plasticity_index += 1
+    assert profile_copy.layers[0] != shared_soil_profile.layers[0]
+
+
+def test_layer_and_stresses(shared_soil_profile):
+    """
+    Test that layer_and_stresses returns the layer and stresses of the separate lookups.
+    """
+    for depth in [1.0, 2.0, 5.0, 30.0]:
+        layer, normal_stress, effective_stress = shared_soil_profile.layer_and_stresses(
+            depth
+        )
+
+        assert layer is shared_soil_profile.get_layer_at_depth(depth)
+        assert normal_stress == shared_soil_profile.calc_normal_stress(depth)
+        assert effective_stress == shared_soil_profile.calc_effective_stress(depth)
+
+
+def test_calc_effective_stress_vec(three_layer_profile):
+    """
+    Test that the vectorized effective stress matches the scalar calculation above and below the GWT.
+    """
+    depths = np.array([1.0, 3.0, 4.0, 6.0])
+    stresses = three_layer_profile.calc_effective_stress_vec(depths)
+
+    np.testing.assert_allclose(stresses, [1.8, 5.5, 6.62, 8.956], rtol=1e-3)
+    for depth, stress in zip(depths, stresses):
+        assert stress == pytest.approx(
+            three_layer_profile.calc_effective_stress(depth), rel=1e-12
+        )
+
+
+def test_soil_layer_validated():
+    """
+    Test that SoilLayer.validated accepts valid input and rejects invalid thickness and unit weights.
+    """
+    layer = SoilLayer.validated(
+        thickness=2.0, dry_unit_weight=1.8, saturated_unit_weight=2.0
+    )
+    assert layer == SoilLayer(
+        thickness=2.0, dry_unit_weight=1.8, saturated_unit_weight=2.0
+    )
+
+    with pytest.raises(ValueError):
+        SoilLayer.validated(thickness=0, dry_unit_weight=1.8, saturated_unit_weight=2.0)
+
+    with pytest.raises(ValueError):
+        SoilLayer.validated(
+            thickness=2.0, dry_unit_weight=-1.8, saturated_unit_weight=2.0
+        )
+
+
+def test_reassign_layers_and_ground_water_level():
+    """
+    Test that assigning new layers or a new GWT updates the depths and stresses.
+    """
+    layer1 = SoilLayer(dry_unit_weight=1.8, saturated_unit_weight=2.0, thickness=2.0)
+    layer2 = SoilLayer(dry_unit_weight=1.9, saturated_unit_weight=2.1, thickness=3.0)
+    soil_profile = SoilProfile(layers=[layer1], ground_water_level=10.0)
+
+    soil_profile.layers = [layer1, layer2]
+    assert layer2.depth == 5.0
+    assert soil_profile.get_layer_index(4.0) == 1
+    assert soil_profile.calc_normal_stress(4.0) == pytest.approx(7.4, rel=1e-3)
+
+    soil_profile.ground_water_level = 2.0
+    assert soil_profile.calc_normal_stress(4.0) == pytest.approx(7.8, rel=1e-3)
+    assert soil_profile.calc_effective_stress(4.0) == pytest.approx(
+        7.8 - 2 * 0.981, rel=1e-3
+    )
+
+
+def test_edit_copied_layer_in_place(three_layer_profile):
+    """
+    Test that editing a layer of a copied profile in place updates its cached lookups.
+    """
+    profile_copy = three_layer_profile.copy()
+    profile_copy.calc_stresses(3.0)
+
+    profile_copy.layers[1].saturated_unit_weight = 2.3
+    profile_copy.layers[2].plasticity_index = 20
+
+    # A profile built from scratch with the edited layers
+    expected = SoilProfile(
+        layers=[replace(layer) for layer in profile_copy.layers],
+        ground_water_level=3.0,
+    )
+
+    depths = np.array([1.0, 3.0, 4.0, 6.0])
+    for depth in depths:
+        assert profile_copy.calc_stresses(depth) == pytest.approx(
+            expected.calc_stresses(depth), rel=1e-12
+        )
+    np.testing.assert_allclose(
+        profile_copy.calc_normal_stress_vec(depths),
+        expected.calc_normal_stress_vec(depths),
+        rtol=1e-12,
+    )
+    np.testing.assert_allclose(
+        profile_copy.calc_effective_stress_vec(depths),
+        expected.calc_effective_stress_vec(depths),
+        rtol=1e-12,
+    )
+    assert profile_copy.calc_stresses(4.0) != three_layer_profile.calc_stresses(4.0)
+
+
+def test_append_layer_in_place():
+    """
+    Test that appending to the layer list updates the layer lookups.
+    """
+    layer1 = SoilLayer(dry_unit_weight=1.8, saturated_unit_weight=2.0, thickness=2.0)
+    soil_profile = SoilProfile(layers=[layer1], ground_water_level=10.0)
+    assert soil_profile.get_layer_index(3.0) == 0
+
+    soil_profile.layers.append(
+        SoilLayer(dry_unit_weight=1.9, saturated_unit_weight=2.1, thickness=3.0)
+    )
+
+    assert soil_profile.get_layer_index(3.0) == 1
+    assert soil_profile.calc_normal_stress(3.0) == pytest.approx(5.5, rel=1e-3)
+
+
+def test_layer_columns(three_layer_profile):
+    """
+    Test that the layer column properties are read-only arrays of the layer values.
+    """
+    np.testing.assert_array_equal(three_layer_profile.layer_bottoms, [2.0, 5.0, 6.5])
+    np.testing.assert_array_equal(three_layer_profile.thicknesses, [2.0, 3.0, 1.5])
+    np.testing.assert_array_equal(three_layer_profile.fine_contents, [0, 0, 0])
+    np.testing.assert_array_equal(three_layer_profile.plasticity_indices, [0, 0, 0])
+
+    with pytest.raises(ValueError):
+        three_layer_profile.thicknesses[0] = 1.0
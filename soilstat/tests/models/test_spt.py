@@ -0,0 +1,55 @@
+import numpy as np
+import pytest
+from soilstat.models.SPT import SPTExp, SPTLog
+
+
+def test_get_exp_indices():
+    """
+    Test that get_exp_indices returns the experiments that get_exp_at_depth returns.
+    """
+    spt_log = SPTLog(
+        [SPTExp(depth=1.5, n=8), SPTExp(depth=4.5, n=12), SPTExp(depth=7.5, n=18)]
+    )
+    depths = np.array([0.5, 1.5, 2.0, 4.5, 6.0, 7.5, 20.0])
+
+    indices = spt_log.get_exp_indices(depths)
+
+    for depth, i in zip(depths, indices):
+        assert spt_log.exps[i] is spt_log.get_exp_at_depth(depth)
+
+
+def test_get_exp_at_depth_unsorted():
+    """
+    Test that experiments given out of depth order are looked up in list order.
+    """
+    spt_log = SPTLog(
+        [SPTExp(depth=4.5, n=12), SPTExp(depth=1.5, n=8), SPTExp(depth=7.5, n=18)]
+    )
+    depths = np.array([0.5, 1.5, 2.0, 4.5, 6.0, 7.5, 20.0])
+
+    # Expected results of scanning the experiments in the order they were given
+    expected = [2, 2, 2, 2, 1, 1, 2]
+
+    for depth, i in zip(depths, expected):
+        assert spt_log.get_exp_at_depth(depth) is spt_log.exps[i]
+    np.testing.assert_array_equal(spt_log.get_exp_indices(depths), expected)
+
+
+def test_exp_columns():
+    """
+    Test that the experiment column properties are read-only arrays of the experiment values.
+    """
+    spt_log = SPTLog(
+        [
+            SPTExp(depth=1.5, n=8, n90=6, n160=12, n160f=14),
+            SPTExp(depth=4.5, n=12, n90=10, n160=16, n160f=19),
+        ]
+    )
+
+    np.testing.assert_array_equal(spt_log.exp_depths, [1.5, 4.5])
+    np.testing.assert_array_equal(spt_log.n160_values, [12, 16])
+    np.testing.assert_array_equal(spt_log.n160f_values, [14, 19])
+    np.testing.assert_array_equal(spt_log.n90_values, [6, 10])
+
+    with pytest.raises(ValueError):
+        spt_log.n90_values[0] = 1